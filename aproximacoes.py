@@ -0,0 +1,166 @@
+"""Análise contínua de aproximações entre trajetórias.
+
+Entre dois passos, cada corpo anda em linha reta. Por isso, num segmento, a separação de um par é
+|d0 + s·v|, com s ∈ [0, 1], onde d0 é a separação no início do segmento e v a sua variação ao longo
+dele. O ponto de menor separação e os instantes em que a separação cruza um limiar saem em forma
+fechada, sem amostrar o segmento. Instantes são medidos em passos (fracionários).
+
+`indexar_encontros` percorre as trajetórias uma única vez. Caixas envolventes por bloco de passos
+descartam os pares que estão longe. Os segmentos que ficam abaixo do limiar vão para um
+`IndiceEncontros`, ordenado por passo, que responde consultas como "encontros a menos de X entre
+os passos a e b" sem voltar às trajetórias.
+"""
+import numpy as np
+
+from instrumentacao import contar, etapa
+
+CAMPOS_ENCONTRO = [
+    ("i", np.int64),
+    ("j", np.int64),
+    ("inicio", np.float64),
+    ("fim", np.float64),
+    ("instante_minimo", np.float64),
+    ("distancia_minima", np.float64),
+]
+
+def minimo_segmentos(d0, v, s_inicio=0.0, s_fim=1.0):
+    """Parâmetro s e distância do ponto de menor separação de cada segmento, com s em [s_inicio, s_fim]."""
+    a = np.einsum("ij,ij->i", v, v)
+    b = np.einsum("ij,ij->i", d0, v)
+    s = np.divide(-b, a, out=np.zeros_like(a), where=a > 0)
+    s = np.clip(s, s_inicio, s_fim)
+    return s, np.linalg.norm(d0 + s[:, None] * v, axis=1)
+
+def intervalos_abaixo(d0, v, limiar, s_inicio=0.0, s_fim=1.0):
+    """Trecho (s1, s2) de cada segmento com separação abaixo de `limiar` e a máscara dos trechos não vazios."""
+    a = np.einsum("ij,ij->i", v, v)
+    b = np.einsum("ij,ij->i", d0, v)
+    c = np.einsum("ij,ij->i", d0, d0) - limiar**2
+    discriminante = b**2 - a * c
+    raiz = np.sqrt(np.maximum(discriminante, 0.0))
+    movendo = a > 0
+    # Sem movimento relativo, o segmento inteiro está abaixo do limiar ou nenhum ponto está
+    s1 = np.where(movendo, np.divide(-b - raiz, a, out=np.zeros_like(a), where=movendo), -np.inf)
+    s2 = np.where(movendo, np.divide(-b + raiz, a, out=np.zeros_like(a), where=movendo), np.inf)
+    s1 = np.maximum(s1, s_inicio)
+    s2 = np.minimum(s2, s_fim)
+    validos = np.where(movendo, discriminante > 0, c < 0) & (s1 < s2)
+    return s1, s2, validos
+
+def aproximacao_minima(trajetoria_a, trajetoria_b):
+    """Instante (em passos) e distância da maior aproximação entre duas trajetórias."""
+    separacao = np.asarray(trajetoria_a, dtype=float) - np.asarray(trajetoria_b, dtype=float)
+    if len(separacao) < 2:
+        return 0.0, float(np.linalg.norm(separacao[0]))
+    s, distancias = minimo_segmentos(separacao[:-1], np.diff(separacao, axis=0))
+    k = int(np.argmin(distancias))
+    return k + float(s[k]), float(distancias[k])
+
+def _unir_trechos(i, j, inicio, fim, instante_minimo, distancia_minima):
+    """Une trechos consecutivos do mesmo par (o fim de um segmento é o início do seguinte) em encontros."""
+    ordem = np.lexsort((inicio, j, i))
+    i, j, inicio, fim = i[ordem], j[ordem], inicio[ordem], fim[ordem]
+    instante_minimo, distancia_minima = instante_minimo[ordem], distancia_minima[ordem]
+    if len(ordem) == 0:
+        return np.zeros(0, dtype=CAMPOS_ENCONTRO)
+
+    novo = np.ones(len(ordem), dtype=bool)
+    novo[1:] = (i[1:] != i[:-1]) | (j[1:] != j[:-1]) | (inicio[1:] > fim[:-1] + 1e-9)
+    inicios_grupos = np.flatnonzero(novo)
+    grupos = np.cumsum(novo) - 1
+
+    encontros = np.zeros(len(inicios_grupos), dtype=CAMPOS_ENCONTRO)
+    encontros["i"] = i[inicios_grupos]
+    encontros["j"] = j[inicios_grupos]
+    encontros["inicio"] = inicio[inicios_grupos]
+    encontros["fim"] = np.maximum.reduceat(fim, inicios_grupos)
+    encontros["distancia_minima"] = np.minimum.reduceat(distancia_minima, inicios_grupos)
+    # Instante do primeiro trecho de cada grupo que atinge a distância mínima do grupo
+    no_minimo = np.flatnonzero(distancia_minima == encontros["distancia_minima"][grupos])
+    _, primeiros = np.unique(grupos[no_minimo], return_index=True)
+    encontros["instante_minimo"] = instante_minimo[no_minimo[primeiros]]
+    return encontros
+
+class IndiceEncontros:
+    """Segmentos com separação abaixo de `limiar`, ordenados por passo, para consultas por intervalo de passos."""
+
+    def __init__(self, limiar, num_passos, i, j, passos, d0, v):
+        ordem = np.argsort(passos, kind="stable")
+        self.limiar = limiar
+        self.num_passos = num_passos
+        self.i = i[ordem]
+        self.j = j[ordem]
+        self.passos = passos[ordem]
+        self.d0 = d0[ordem]
+        self.v = v[ordem]
+
+    def __len__(self):
+        return len(self.passos)
+
+    def consultar(self, distancia=None, passo_inicial=0.0, passo_final=None):
+        """Encontros a menos de `distancia` (padrão: o limiar do índice) entre os passos dados, como array estruturado.
+
+        Cada encontro traz o par (i, j), o intervalo contínuo [inicio, fim] abaixo da distância, recortado
+        aos passos consultados, e o instante e a distância da maior aproximação dentro dele.
+        """
+        distancia = self.limiar if distancia is None else distancia
+        if distancia > self.limiar:
+            raise ValueError(f"Distância {distancia} acima do limiar do índice ({self.limiar}); reconstrua o índice")
+        passo_final = self.num_passos - 1 if passo_final is None else passo_final
+
+        # Segmento k cobre os instantes [k, k + 1]
+        inicio = np.searchsorted(self.passos, np.floor(passo_inicial), side="left")
+        fim = np.searchsorted(self.passos, np.ceil(passo_final), side="left")
+        passos = self.passos[inicio:fim]
+        d0, v = self.d0[inicio:fim], self.v[inicio:fim]
+        s_inicio = np.clip(passo_inicial - passos, 0.0, 1.0)
+        s_fim = np.clip(passo_final - passos, 0.0, 1.0)
+
+        s1, s2, validos = intervalos_abaixo(d0, v, distancia, s_inicio, s_fim)
+        s_minimo, distancias = minimo_segmentos(d0, v, s_inicio, s_fim)
+        contar("segmentos_consultados", len(passos))
+        return _unir_trechos(
+            self.i[inicio:fim][validos], self.j[inicio:fim][validos],
+            (passos + s1)[validos], (passos + s2)[validos],
+            (passos + s_minimo)[validos], distancias[validos],
+        )
+
+def indexar_encontros(trajetorias, limiar, tamanho_bloco=256):
+    """Monta o `IndiceEncontros` de todos os pares de trajetórias (mesmo número de passos) para `limiar`."""
+    pontos = np.stack([np.asarray(trajetoria, dtype=float) for trajetoria in trajetorias])
+    num_corpos, num_passos, _ = pontos.shape
+    num_segmentos = max(num_passos - 1, 0)
+    encontrados = {"i": [], "j": [], "passos": [], "d0": [], "v": []}
+
+    with etapa("indexar_encontros"):
+        if num_segmentos:
+            # Caixa envolvente de cada corpo por bloco de segmentos (pontos do bloco mais o ponto final)
+            inicios = np.arange(0, num_segmentos, tamanho_bloco)
+            finais = np.append(inicios[1:], num_passos - 1)
+            minimos = np.minimum(np.minimum.reduceat(pontos[:, :-1], inicios, axis=1), pontos[:, finais])
+            maximos = np.maximum(np.maximum.reduceat(pontos[:, :-1], inicios, axis=1), pontos[:, finais])
+            deslocamentos = np.arange(tamanho_bloco)
+
+            for i in range(num_corpos - 1):
+                folga = np.maximum(0.0, np.maximum(minimos[i + 1:] - maximos[i], minimos[i] - maximos[i + 1:]))
+                candidatos = np.linalg.norm(folga, axis=2) < limiar  # (pares com i, blocos)
+                for outro in np.flatnonzero(candidatos.any(axis=1)):
+                    j = i + 1 + outro
+                    passos = (inicios[candidatos[outro]][:, None] + deslocamentos).ravel()
+                    passos = passos[passos < num_segmentos]
+                    d0 = pontos[i, passos] - pontos[j, passos]
+                    v = pontos[i, passos + 1] - pontos[j, passos + 1] - d0
+                    _, distancias = minimo_segmentos(d0, v)
+                    proximos = distancias < limiar
+                    contar("segmentos_avaliados", len(passos))
+                    encontrados["i"].append(np.full(proximos.sum(), i))
+                    encontrados["j"].append(np.full(proximos.sum(), j))
+                    encontrados["passos"].append(passos[proximos])
+                    encontrados["d0"].append(d0[proximos])
+                    encontrados["v"].append(v[proximos])
+
+    dimensao = pontos.shape[2]
+    vazios = {"i": np.zeros(0, np.int64), "j": np.zeros(0, np.int64), "passos": np.zeros(0, np.int64),
+              "d0": np.zeros((0, dimensao)), "v": np.zeros((0, dimensao))}
+    colunas = {nome: np.concatenate(partes) if partes else vazios[nome] for nome, partes in encontrados.items()}
+    return IndiceEncontros(limiar, num_passos, colunas["i"], colunas["j"], colunas["passos"], colunas["d0"], colunas["v"])
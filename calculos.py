@@ -0,0 +1,475 @@
+"""Funções de cálculo do Universo Áureo, independentes de Streamlit, Folium e Plotly.
+
+Usadas pelo aplicativo (`main.py`) e pela execução em lote (`lote.py`).
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from aproximacoes import indexar_encontros
+from avaliacao import avaliar
+from instrumentacao import contar, etapa
+from pipeline import Pipeline
+
+# ==================================================
+# Constantes Físicas
+# ==================================================
+c = 3e8  # Velocidade da luz em m/s
+G = 6.67430e-11  # Constante gravitacional em m^3 kg^-1 s^-2
+ano_luz = 9.461e15  # Distância que a luz percorre em um ano (em metros)
+h = 6.626e-34  # Constante de Planck (J·s)
+e = 1.602e-19  # Carga do elétron (C)
+phi = 1.61803398875  # Proporção áurea
+
+# ==================================================
+# Geradores Aleatórios
+# ==================================================
+# Toda função estocástica recebe `semente`: um inteiro, uma SeedSequence, um Generator já criado ou
+# None (entropia do sistema). Nada usa o estado global de `np.random`, então a mesma semente produz o
+# mesmo resultado em qualquer thread ou processo, e (parâmetros, semente) serve como chave de cache.
+# Inteiros e SeedSequences são valores: a mesma semente dá sempre o mesmo resultado. Um Generator é
+# estado: cada chamada consome (ou, ao dividir, avança) o Generator e produz valores novos.
+def gerador(semente=None):
+    """Generator do NumPy a partir de uma semente (um Generator recebido é devolvido como está)."""
+    return np.random.default_rng(semente)
+
+def sementes_independentes(semente, quantidade):
+    """Divide `semente` em `quantidade` SeedSequences independentes (uma por execução, membro ou trabalhador)."""
+    if isinstance(semente, np.random.Generator):
+        # Como `gerador`, um Generator avança: chamadas repetidas com o mesmo Generator dão filhas novas
+        return semente.bit_generator.seed_seq.spawn(quantidade)
+    raiz = semente if isinstance(semente, np.random.SeedSequence) else np.random.SeedSequence(semente)
+    # Filhas derivadas pela spawn_key, como `raiz.spawn`, mas sem avançar o contador da raiz:
+    # a mesma semente dá sempre as mesmas filhas
+    return [
+        np.random.SeedSequence(raiz.entropy, spawn_key=raiz.spawn_key + (k,), pool_size=raiz.pool_size)
+        for k in range(quantidade)
+    ]
+
+# ==================================================
+# Funções de Cálculo
+# ==================================================
+def calcular_frequencias(frequencia_alvo, harmonico_aureo):
+    """Calcula frequências harmônicas áureas."""
+    return [frequencia_alvo * (1 + 0.61803398875)**i for i in range(harmonico_aureo)]
+
+def detectar_anomalias_isolation_forest(dados):
+    """Detecta anomalias usando Isolation Forest."""
+    from sklearn.ensemble import IsolationForest  # Importado sob demanda: só este cálculo usa scikit-learn
+
+    with etapa("isolation_forest"):
+        iso_forest = IsolationForest(contamination=0.05, random_state=42)
+        anomalias = iso_forest.fit_predict(dados)
+    contar("pontos_avaliados", len(dados))
+    return anomalias == -1  # Retorna True para anomalias
+
+def distorcao_espaco_tempo(massa, distancia, modelo):
+    """Calcula a distorção do espaço-tempo com base no modelo escolhido."""
+    if modelo == "Clássico":
+        return (2 * G * massa) / (c**2 * distancia)
+    elif modelo == "Fluxo Matemático":
+        return (2 * G * massa) / (c**2 * distancia) * np.exp(-distancia / (1e9 * ano_luz))
+    else:
+        return 0
+
+def calcular_orbita(massa_bn, massa_planeta, perturbacao, num_passos=1000, dt=0.05, semente=None):
+    """Simula a órbita de um planeta em torno de um buraco negro."""
+    posicao = np.array([1.0, 0.0])
+    velocidade = np.array([0.0, 1.0])
+    trajetoria = []
+    energia_orbita = []
+    ruido = perturbacao * gerador(semente).normal(0, 1, (num_passos, 2))
+    
+    with etapa("integrador_orbita"):
+        for passo in range(num_passos):
+            r = np.linalg.norm(posicao)
+            aceleracao = -G * massa_bn / r**3 * posicao + ruido[passo]
+            velocidade += aceleracao * dt
+            posicao += velocidade * dt
+            trajetoria.append(posicao.copy())
+            energia_orbita.append(0.5 * massa_planeta * np.linalg.norm(velocidade)**2 - G * massa_bn * massa_planeta / r)
+    contar("passos_integrados", num_passos)
+    
+    return np.array(trajetoria), np.array(energia_orbita)
+
+def calcular_colisao_asteroide(distancias_planetas, rotacoes_planetas, tamanhos_planetas, semente=None):
+    """Simula a possibilidade de colisão de asteroides com os planetas."""
+    rng = gerador(semente)
+    colisoes = []
+    for i in range(len(distancias_planetas)):
+        # Simulação simples: colisão se o asteroide estiver dentro do raio do planeta
+        raio_planeta = tamanhos_planetas[i] * ano_luz
+        colisoes.append(bool(rng.random() < 0.1))  # 10% de chance de colisão (exemplo)
+    return colisoes
+
+def fatores_projecao(prob_min, prob_max, tempo_decorrido, eventos, tempo_total=90):
+    """Fator combinado de tempo e eventos aplicado às probabilidades (aceita arrays com broadcasting).
+
+    Única definição do ajuste: a projeção direta, o tensor pré-calculado e o Monte Carlo usam esta função.
+    """
+    fator_correcao = 1 + (tempo_decorrido / tempo_total) * (((prob_min + prob_max) / 2) / prob_min)
+    fator_evento = 1 + (eventos * 0.05)  # Cada evento influencia a probabilidade em 5%
+    return fator_correcao * fator_evento
+
+def aplicar_distorcao_espaco_tempo(probabilidades, tempo_decorrido, eventos, tempo_total=90):
+    """Ajusta as probabilidades com base no tempo decorrido e nos eventos."""
+    probabilidades_ajustadas = {}
+    for evento, (prob_min, prob_max) in probabilidades.items():
+        fator = fatores_projecao(prob_min, prob_max, tempo_decorrido, eventos, tempo_total)
+        probabilidades_ajustadas[evento] = (prob_min * fator, prob_max * fator)
+    return probabilidades_ajustadas
+
+def energia_quantica_fluxo(frequencia):
+    """Calcula a energia quântica de um fóton: E = h * f."""
+    return h * frequencia
+
+def tensao_fluxo(energia):
+    """Calcula a tensão equivalente: V = E / e."""
+    return energia / e
+
+def calcular_campo_magnetico(distancias_planetas, massas_planetas):
+    """Calcula as oscilações do campo magnético."""
+    campo_magnetico = []
+    for i in range(len(distancias_planetas)):
+        # Simulação simples: campo magnético proporcional à massa e inversamente proporcional à distância
+        campo_magnetico.append(massas_planetas[i] / distancias_planetas[i])
+    return campo_magnetico
+
+# ==================================================
+# Sistema Planetário e Espaço-Tempo
+# ==================================================
+def simular_translacao_planetas(massa_astro_central, massas_planetas, distancias_planetas, tamanhos_planetas, modelo, num_passos=1000, dt=0.05,
+                                semente=None):
+    """Simula o movimento de translação dos planetas ao redor do astro central.
+
+    Cada planeta tem o seu próprio fluxo aleatório: incluir um planeta não altera a perturbação dos demais.
+    """
+    trajetorias = []
+    colisoes = []  # Armazenar informações sobre colisões
+    sementes = sementes_independentes(semente, len(massas_planetas))
+    
+    with etapa("integrador_translacao"):
+        for i in range(len(massas_planetas)):
+            # Posição inicial do planeta (distância no eixo X)
+            posicao = np.array([distancias_planetas[i], 0.0])
+            velocidade = np.array([0.0, np.sqrt(G * massa_astro_central / distancias_planetas[i])])  # Velocidade orbital inicial
+            trajetoria = []
+            if modelo == "Fluxo Matemático":
+                perturbacoes = gerador(sementes[i]).normal(0, 1e-6, (num_passos, 2))
+        
+            for passo in range(num_passos):
+                r = np.linalg.norm(posicao)
+                aceleracao = -G * massa_astro_central / r**3 * posicao  # Aceleração gravitacional
+            
+                # Aplicar perturbação no modelo de fluxo matemático
+                if modelo == "Fluxo Matemático":
+                    aceleracao += perturbacoes[passo]  # Perturbação aleatória
+            
+                velocidade += aceleracao * dt
+                posicao += velocidade * dt
+                trajetoria.append(posicao.copy())
+        
+            trajetorias.append(np.array(trajetoria))
+    
+    # Verificar colisões entre planetas
+    with etapa("colisoes_planetas"):
+        for i in range(len(trajetorias)):
+            for j in range(i + 1, len(trajetorias)):
+                distancias = np.linalg.norm(trajetorias[i] - trajetorias[j], axis=1)
+                raio_total = tamanhos_planetas[i] + tamanhos_planetas[j]
+                if np.any(distancias < raio_total):
+                    colisoes.append((i, j, np.where(distancias < raio_total)[0]))
+    contar("passos_integrados", num_passos * len(massas_planetas))
+    
+    return trajetorias, colisoes
+
+def calcular_malha_distorcao(massa_astro_central, massas_planetas, distancias_planetas, modelo, extensao=2000, resolucao=20):
+    """Calcula a malha do tecido espaço-tempo distorcida pelo astro central e pelos planetas."""
+    x = np.linspace(-extensao, extensao, resolucao)
+    y = np.linspace(-extensao, extensao, resolucao)
+    X, Y = np.meshgrid(x, y)
+    Z = np.zeros_like(X)
+    
+    # Aplicando a distorção gravitacional
+    with etapa("malha_distorcao"):
+        for i in range(X.shape[0]):
+            for j in range(X.shape[1]):
+                r_astro_central = np.sqrt(X[i, j]**2 + Y[i, j]**2)
+                Z[i, j] -= distorcao_espaco_tempo(massa_astro_central, r_astro_central * ano_luz, modelo)
+                for k in range(len(massas_planetas)):
+                    r_planeta = np.sqrt((X[i, j] - distancias_planetas[k])**2 + Y[i, j]**2)
+                    Z[i, j] -= distorcao_espaco_tempo(massas_planetas[k], r_planeta * ano_luz, modelo)
+    contar("pontos_de_grade", Z.size)
+    return X, Y, Z
+
+def pipeline_sistema_planetario():
+    """Pipeline do Sistema Planetário: a malha só é refeita quando massas, distâncias ou modelo mudam.
+
+    Parâmetros: massa_astro_central, massas_planetas, distancias_planetas, tamanhos_planetas,
+    rotacoes_planetas, modelo, semente_colisao, semente_translacao e, para "encontros", limiar_encontros.
+    """
+    pipeline = Pipeline()
+    pipeline.definir("malha", "massa_astro_central", "massas_planetas", "distancias_planetas", "modelo")(calcular_malha_distorcao)
+    pipeline.definir("colisoes_asteroides", "distancias_planetas", "rotacoes_planetas", "tamanhos_planetas", "semente_colisao")(
+        calcular_colisao_asteroide
+    )
+    pipeline.definir("campo_magnetico", "distancias_planetas", "massas_planetas")(calcular_campo_magnetico)
+    pipeline.definir("translacao", "massa_astro_central", "massas_planetas", "distancias_planetas", "tamanhos_planetas",
+                     "modelo", "semente_translacao")(
+        lambda massa, massas, distancias, tamanhos, modelo, semente: simular_translacao_planetas(
+            massa, massas, distancias, tamanhos, modelo, semente=semente
+        )
+    )
+    pipeline.definir("encontros", "translacao", "limiar_encontros")(
+        lambda translacao, limiar: indexar_encontros(translacao[0], limiar)
+    )
+    return pipeline
+
+# ==================================================
+# Captação e Transformação de Energia
+# ==================================================
+def corrente_fluxo(P, V_F, theta_F):
+    """Calcula a corrente em fluxo: I = P / (V_F * cos(theta_F))."""
+    return P / (V_F * np.cos(np.radians(theta_F)))
+
+def energia_perdida(E_F, alpha, R_l):
+    """Calcula a energia perdida: E_p = E_F * alpha * R_l."""
+    return E_F * alpha * R_l
+
+def energia_singularidade(E_F, alpha, R_l):
+    """Calcula a energia em singularidade: E_singularidade = E_F * (1 + alpha) / R_l."""
+    return E_F * (1 + alpha) / R_l
+
+def bobina_aurea(f_F, R_l):
+    """Calcula a energia captada pela bobina áurea."""
+    return (0.5 * 1e-3 * (f_F / R_l)**2)
+
+def calcular_captacao_energia(P, f_F, theta_F, R_l, alpha):
+    """Calcula as grandezas de energia, a série de energia armazenada e o campo 3D do fluxo."""
+    E_F = energia_quantica_fluxo(f_F)
+    V_F = tensao_fluxo(E_F)
+    I_F = corrente_fluxo(P, V_F, theta_F)
+    
+    # Energia ao longo do tempo
+    tempo = np.linspace(0, 0.1, 1000)
+    energia_armazenada = (0.5 * 1e-3 * I_F**2) * (1 + alpha) * np.sin(2 * np.pi * f_F * tempo)
+    
+    # Campo 3D do fluxo de energia
+    x = np.linspace(-10, 10, 20)
+    y = np.linspace(-10, 10, 20)
+    X, Y = np.meshgrid(x, y)
+    Z = avaliar("sin(sqrt(X**2 + Y**2)) * I_F", {"X": X, "Y": Y, "I_F": I_F})  # Simulação de um campo de energia
+    
+    return {
+        "E_F": E_F,
+        "V_F": V_F,
+        "I_F": I_F,
+        "E_p": energia_perdida(E_F, alpha, R_l),
+        "E_singularidade": energia_singularidade(E_F, alpha, R_l),
+        "energia_bobina": bobina_aurea(f_F, R_l),
+        "tempo": tempo,
+        "energia_armazenada": energia_armazenada,
+        "X": X,
+        "Y": Y,
+        "Z": Z,
+    }
+
+# ==================================================
+# Frequências Áureas e Territórios
+# ==================================================
+def sintetizar_sinal_harmonico(frequencias, tempo):
+    """Soma os harmônicos amortecidos e normaliza o sinal para amplitude máxima 1."""
+    sinal = np.sum([np.sin(2 * np.pi * f * tempo) * np.exp(-0.1 * tempo) for f in frequencias], axis=0)
+    sinal /= np.max(np.abs(sinal))
+    return sinal
+
+def simular_pontos_termicos(latitude, longitude, num_pontos, semente=42):
+    """Sorteia os pontos térmicos ao redor da coordenada e calcula desequilíbrios e radiação térmica."""
+    rng = gerador(semente)
+    latitudes = latitude + rng.uniform(-0.1, 0.1, num_pontos)
+    longitudes = longitude + rng.uniform(-0.1, 0.1, num_pontos)
+    temperaturas = rng.uniform(20, 40, num_pontos)
+    return {
+        "latitudes": latitudes,
+        "longitudes": longitudes,
+        "temperaturas": temperaturas,
+        "desequilibrios": np.abs(temperaturas - np.mean(temperaturas)),
+        "radiacao_termica": avaliar("5.67e-8 * (temperaturas + 273.15)**4", {"temperaturas": temperaturas}),
+    }
+
+def sinal_frequencias_aureas(frequencia_alvo, harmonico_aureo, num_pontos):
+    """Frequências harmônicas áureas e o sinal detectado amostrado em `num_pontos` instantes."""
+    frequencias = calcular_frequencias(frequencia_alvo, harmonico_aureo)
+    tempo = np.linspace(0, 0.1, num_pontos)
+    with etapa("sinal_harmonico"):
+        sinal_detectado = sintetizar_sinal_harmonico(frequencias, tempo)
+    return {"frequencias": np.array(frequencias), "tempo": tempo, "sinal_detectado": sinal_detectado}
+
+def energia_armazenada_sinal(sinal_detectado, alpha):
+    """Energia armazenada pelo sinal, amplificada pelo fator de gratidão quântica (1 + α)."""
+    return avaliar("(0.5 * 1e-3 * sinal_detectado**2) * (1 + alpha)", {"sinal_detectado": sinal_detectado, "alpha": alpha})
+
+def distorcao_gravidade_energia(energia_armazenada):
+    """Distorção da gravidade causada pela massa equivalente da energia armazenada."""
+    # Massa equivalente E / c² na mesma passada
+    return avaliar("(2 * G * (energia_armazenada / c**2)) / (c**2 * 1e-9)", {"energia_armazenada": energia_armazenada, "G": G, "c": c})
+
+def detectar_anomalias_territorio(desequilibrios, distorcao_gravidade, radiacao_termica, energia_armazenada):
+    """Anomalias por Isolation Forest sobre desequilíbrio, distorção, radiação e energia."""
+    dados_anomalias = np.column_stack((desequilibrios, distorcao_gravidade, radiacao_termica, energia_armazenada))
+    return detectar_anomalias_isolation_forest(dados_anomalias)
+
+def pipeline_frequencias_aureas():
+    """Pipeline das Frequências Áureas: mudar só α refaz energia, distorção e anomalias, sem sortear os pontos nem sintetizar o sinal.
+
+    Parâmetros: latitude, longitude, num_pontos, semente, frequencia_alvo, harmonico_aureo e alpha.
+    """
+    pipeline = Pipeline()
+    pipeline.definir("dados_termicos", "latitude", "longitude", "num_pontos", "semente")(simular_pontos_termicos)
+    pipeline.definir("sinal", "frequencia_alvo", "harmonico_aureo", "num_pontos")(sinal_frequencias_aureas)
+    pipeline.definir("energia_armazenada", "sinal", "alpha")(
+        lambda sinal, alpha: energia_armazenada_sinal(sinal["sinal_detectado"], alpha)
+    )
+    pipeline.definir("distorcao_gravidade", "energia_armazenada")(distorcao_gravidade_energia)
+    pipeline.definir("anomalias", "dados_termicos", "energia_armazenada", "distorcao_gravidade")(
+        lambda dados, energia, distorcao: detectar_anomalias_territorio(
+            dados["desequilibrios"], distorcao, dados["radiacao_termica"], energia
+        )
+    )
+    return pipeline
+
+def resultado_frequencias_aureas(etapas):
+    """Junta as etapas do pipeline no dicionário retornado por `calcular_frequencias_aureas`."""
+    return {
+        **etapas["dados_termicos"],
+        **etapas["sinal"],
+        "energia_armazenada": etapas["energia_armazenada"],
+        "distorcao_gravidade": etapas["distorcao_gravidade"],
+        "anomalias": etapas["anomalias"],
+    }
+
+ETAPAS_FREQUENCIAS_AUREAS = ("dados_termicos", "sinal", "energia_armazenada", "distorcao_gravidade", "anomalias")
+
+def calcular_frequencias_aureas(frequencia_alvo, alpha, harmonico_aureo, latitude, longitude, num_pontos, semente=42):
+    """Simula os pontos térmicos, o sinal harmônico, a energia, a radiação, a distorção da gravidade e as anomalias."""
+    etapas = pipeline_frequencias_aureas().calcular(
+        ETAPAS_FREQUENCIAS_AUREAS, frequencia_alvo=frequencia_alvo, alpha=alpha, harmonico_aureo=harmonico_aureo,
+        latitude=latitude, longitude=longitude, num_pontos=num_pontos, semente=semente
+    )
+    return resultado_frequencias_aureas(etapas)
+
+# ==================================================
+# Aplicações e Cálculo Infinito (ODDS)
+# ==================================================
+def calcular_aplicacoes(probabilidades_ajustadas, valor_esperado):
+    """Calcula as aplicações com base nas probabilidades ajustadas e no valor esperado."""
+    aplicacoes = {}
+    for evento, (prob_min, prob_max) in probabilidades_ajustadas.items():
+        aplicacoes[evento] = valor_esperado * (prob_min + prob_max) / 2
+    return aplicacoes
+
+def calcular_tensor_projecao(probabilidades, tempo_total=90, max_eventos=10):
+    """Pré-calcula os fatores de projeção para cada minuto (0..tempo_total) × eventos significativos × evento cósmico.
+
+    O tensor tem forma (tempo_total + 1, max_eventos + 1, número de eventos) em float32; a projeção de
+    qualquer combinação de tempo e eventos passa a ser uma indexação, sem recálculo.
+    """
+    prob_min = np.array([prob[0] for prob in probabilidades.values()], dtype=float)
+    prob_max = np.array([prob[1] for prob in probabilidades.values()], dtype=float)
+    tempos = np.arange(tempo_total + 1).reshape(-1, 1, 1)
+    eventos = np.arange(max_eventos + 1).reshape(1, -1, 1)
+    return fatores_projecao(prob_min, prob_max, tempos, eventos, tempo_total).astype(np.float32)
+
+def projecao_do_tensor(tensor, probabilidades, tempo_decorrido, eventos):
+    """Lê do tensor pré-calculado as probabilidades ajustadas, no mesmo formato de `aplicar_distorcao_espaco_tempo`."""
+    fatores = tensor[int(tempo_decorrido), int(eventos)]
+    return {
+        evento: (prob_min * float(fator), prob_max * float(fator))
+        for (evento, (prob_min, prob_max)), fator in zip(probabilidades.items(), fatores)
+    }
+
+def _bloco_monte_carlo_odds(semente, num_cenarios, prob_min, prob_max, faixa_tempo, faixa_eventos,
+                            valor_esperado, limites, num_bins, tempo_total):
+    """Amostra um bloco de cenários com um fluxo aleatório independente e acumula histogramas por evento."""
+    rng = np.random.default_rng(semente)
+    num_eventos = prob_min.size
+    tempo = rng.integers(faixa_tempo[0], faixa_tempo[1], size=(num_cenarios, 1), endpoint=True)
+    eventos = rng.integers(faixa_eventos[0], faixa_eventos[1], size=(num_cenarios, 1), endpoint=True)
+    valores = rng.random((num_cenarios, num_eventos))
+    valores *= prob_max - prob_min
+    valores += prob_min
+    valores *= fatores_projecao(prob_min, prob_max, tempo, eventos, tempo_total)
+    valores *= valor_esperado
+
+    # Histograma de largura fixa, com faixa própria por evento: blocos são combinados somando contagens,
+    # sem guardar as amostras
+    minimos, maximos = limites
+    indices = ((valores - minimos) / (maximos - minimos) * num_bins).astype(np.int64)
+    np.clip(indices, 0, num_bins - 1, out=indices)
+    indices += np.arange(num_eventos) * num_bins
+    contagens = np.bincount(indices.ravel(), minlength=num_eventos * num_bins).reshape(num_eventos, num_bins)
+    return contagens, valores.sum(axis=0), np.square(valores).sum(axis=0)
+
+def _quantis_histograma(contagens, minimo, maximo, quantis):
+    """Interpola quantis a partir das contagens acumuladas de um histograma."""
+    bordas = np.linspace(minimo, maximo, contagens.size + 1)
+    acumulado = np.concatenate(([0], np.cumsum(contagens)))
+    return np.interp(np.asarray(quantis) * acumulado[-1], acumulado, bordas)
+
+def simular_monte_carlo_odds(probabilidades, faixa_tempo, faixa_eventos, valor_esperado, num_cenarios=1_000_000,
+                             quantis=(0.05, 0.25, 0.5, 0.75, 0.95), nivel_confianca=0.9, semente=None,
+                             num_trabalhadores=None, tamanho_bloco=250_000, num_bins=4096, tempo_total=90):
+    """Projeta as ODDS por Monte Carlo vetorizado sobre as faixas de probabilidade, tempo e eventos.
+
+    Cada bloco de cenários recebe um fluxo próprio de `SeedSequence.spawn`, então o resultado depende
+    apenas da semente e não do número de trabalhadores. Retorna, por evento, média, desvio padrão,
+    quantis e a banda central com o nível de confiança pedido.
+    """
+    nomes = list(probabilidades.keys())
+    prob_min = np.array([probabilidades[evento][0] for evento in nomes], dtype=float)
+    prob_max = np.array([probabilidades[evento][1] for evento in nomes], dtype=float)
+
+    # Limites analíticos dos valores possíveis de cada evento, usados como faixa do seu histograma
+    minimos = valor_esperado * prob_min * fatores_projecao(prob_min, prob_max, faixa_tempo[0], faixa_eventos[0], tempo_total)
+    maximos = valor_esperado * prob_max * fatores_projecao(prob_min, prob_max, faixa_tempo[1], faixa_eventos[1], tempo_total)
+    maximos = np.maximum(maximos, minimos + np.maximum(np.abs(minimos), 1.0) * 1e-12)
+
+    tamanhos = [tamanho_bloco] * (num_cenarios // tamanho_bloco)
+    if num_cenarios % tamanho_bloco:
+        tamanhos.append(num_cenarios % tamanho_bloco)
+    sementes = sementes_independentes(semente, len(tamanhos))
+
+    contagens = np.zeros((len(nomes), num_bins), dtype=np.int64)
+    soma = np.zeros(len(nomes))
+    soma_quadrados = np.zeros(len(nomes))
+    with etapa("monte_carlo_odds"):
+        with ThreadPoolExecutor(max_workers=num_trabalhadores or os.cpu_count()) as executor:
+            blocos = executor.map(
+                lambda args: _bloco_monte_carlo_odds(args[0], args[1], prob_min, prob_max, faixa_tempo, faixa_eventos,
+                                                     valor_esperado, (minimos, maximos), num_bins, tempo_total),
+                zip(sementes, tamanhos)
+            )
+            for contagens_bloco, soma_bloco, soma_quadrados_bloco in blocos:
+                contagens += contagens_bloco
+                soma += soma_bloco
+                soma_quadrados += soma_quadrados_bloco
+    contar("cenarios", num_cenarios)
+
+    media = soma / num_cenarios
+    desvio = np.sqrt(np.maximum(soma_quadrados / num_cenarios - media**2, 0.0))
+    cauda = (1 - nivel_confianca) / 2
+    resultados = {}
+    for k, evento in enumerate(nomes):
+        valores_quantis = _quantis_histograma(contagens[k], minimos[k], maximos[k], list(quantis) + [cauda, 1 - cauda])
+        resultados[evento] = {
+            "media": float(media[k]),
+            "desvio": float(desvio[k]),
+            "quantis": {q: float(v) for q, v in zip(quantis, valores_quantis[:-2])},
+            "banda": (float(valores_quantis[-2]), float(valores_quantis[-1])),
+        }
+    return resultados
+
+def calcular_distorcao_eventos(probabilidades_ajustadas, semente=None):
+    """Sorteia a intensidade da distorção do tecido espaço-tempo para cada evento."""
+    return gerador(semente).normal(0, 1, len(probabilidades_ajustadas)).tolist()
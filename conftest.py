@@ -0,0 +1 @@
+# Marca a raiz do projeto para o pytest: os módulos do aplicativo ficam importáveis a partir de tests/
@@ -0,0 +1,204 @@
+"""Benchmarks dos caminhos críticos de cálculo, com comparação contra uma linha de base.
+
+Cada benchmark roda em vários tamanhos de problema e registra tempo de parede (mediana e mínimo
+das repetições), vazão (passos/s, pontos de grade/s, pontos avaliados/s...) e pico de memória
+(medido numa execução extra com `tracemalloc`, que também rastreia as alocações do NumPy).
+
+Uso::
+
+    python desempenho.py executar --saida atual.json
+    python desempenho.py executar --filtro orbita --repeticoes 5 --saida atual.json
+    python desempenho.py comparar atual.json --base linha_de_base.json --tolerancia 0.10
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from avaliacao import avaliar
+from calculos import (
+    aplicar_distorcao_espaco_tempo,
+    calcular_aplicacoes,
+    calcular_malha_distorcao,
+    calcular_orbita,
+    calcular_tensor_projecao,
+    detectar_anomalias_isolation_forest,
+    simular_monte_carlo_odds,
+    simular_translacao_planetas,
+    sintetizar_sinal_harmonico,
+)
+
+# ==================================================
+# Casos de benchmark
+# ==================================================
+# Cada caso: nome -> (unidade da vazão, tamanhos, preparar(tamanho) -> (função sem argumentos, unidades processadas))
+def _orbita(num_passos):
+    return lambda: calcular_orbita(1e31, 1e24, 0.02, num_passos=num_passos, semente=0), num_passos
+
+def _translacao(num_planetas, num_passos=2000):
+    massas = [1e24] * num_planetas
+    distancias = list(np.linspace(1.0, 1.0 + 0.0001 * num_planetas, num_planetas))
+    tamanhos = [0.0001] * num_planetas
+    return (
+        lambda: simular_translacao_planetas(1e30, massas, distancias, tamanhos, "Fluxo Matemático", num_passos=num_passos, semente=0),
+        num_planetas * num_passos,
+    )
+
+def _malha_distorcao(resolucao, num_planetas=5):
+    massas = [1e24] * num_planetas
+    distancias = list(np.linspace(100.0, 1500.0, num_planetas))
+    return lambda: calcular_malha_distorcao(1e30, massas, distancias, "Fluxo Matemático", resolucao=resolucao), resolucao**2
+
+def _campo_captacao(num_pontos):
+    eixo = np.linspace(-10, 10, int(np.sqrt(num_pontos)))
+    X, Y = np.meshgrid(eixo, eixo)
+    return lambda: avaliar("sin(sqrt(X**2 + Y**2)) * I_F", {"X": X, "Y": Y, "I_F": 3.7}), X.size
+
+def _isolation_forest(num_pontos):
+    dados = np.random.default_rng(0).normal(size=(num_pontos, 4))
+    return lambda: detectar_anomalias_isolation_forest(dados), num_pontos
+
+def _sinal_harmonico(num_pontos, num_harmonicos=10):
+    frequencias = [432 * (1 + 0.61803398875)**i for i in range(num_harmonicos)]
+    tempo = np.linspace(0, 0.1, num_pontos)
+    return lambda: sintetizar_sinal_harmonico(frequencias, tempo), num_pontos * num_harmonicos
+
+def _probabilidades(num_eventos):
+    rng = np.random.default_rng(0)
+    minimos = rng.uniform(1.01, 5.0, num_eventos)
+    return {f"Evento {i}": (minimos[i], minimos[i] + rng.uniform(0, 5.0)) for i in range(num_eventos)}
+
+def _odds_projecao(num_eventos):
+    probabilidades = _probabilidades(num_eventos)
+    return lambda: calcular_aplicacoes(aplicar_distorcao_espaco_tempo(probabilidades, 45, 3), 3.0), num_eventos
+
+def _odds_tensor(num_eventos):
+    probabilidades = _probabilidades(num_eventos)
+    return lambda: calcular_tensor_projecao(probabilidades), 91 * 11 * num_eventos
+
+def _odds_monte_carlo(num_cenarios):
+    probabilidades = _probabilidades(8)
+    return lambda: simular_monte_carlo_odds(probabilidades, (0, 90), (0, 10), 3.0, num_cenarios=num_cenarios, semente=0), num_cenarios
+
+CASOS = {
+    "calcular_orbita": ("passos", [1_000, 10_000, 50_000], _orbita),
+    "simular_translacao_planetas": ("passos×planeta", [2, 5, 10], _translacao),
+    "malha_distorcao": ("pontos de grade", [20, 50, 100], _malha_distorcao),
+    "campo_captacao": ("pontos de grade", [100_000, 1_000_000, 10_000_000], _campo_captacao),
+    "detectar_anomalias_isolation_forest": ("pontos avaliados", [100, 1_000, 10_000], _isolation_forest),
+    "sintetizar_sinal_harmonico": ("amostras×harmônico", [1_000, 100_000, 1_000_000], _sinal_harmonico),
+    "odds_projecao": ("eventos", [8, 1_000, 100_000], _odds_projecao),
+    "odds_tensor_projecao": ("células do tensor", [8, 100, 1_000], _odds_tensor),
+    "odds_monte_carlo": ("cenários", [100_000, 1_000_000, 4_000_000], _odds_monte_carlo),
+}
+
+# ==================================================
+# Execução
+# ==================================================
+def medir(funcao, repeticoes):
+    """Tempos de parede das repetições e pico de memória de uma execução extra (os casos fixam as próprias sementes)."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+
+    tracemalloc.start()
+    try:
+        funcao()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return tempos, pico
+
+def executar_benchmarks(filtro=None, repeticoes=3):
+    resultados = []
+    for nome, (unidade, tamanhos, preparar) in CASOS.items():
+        if filtro and filtro not in nome:
+            continue
+        for tamanho in tamanhos:
+            funcao, unidades = preparar(tamanho)
+            funcao()  # Aquecimento: importações sob demanda e caches fora da medição
+            tempos, pico = medir(funcao, repeticoes)
+            mediana = statistics.median(tempos)
+            resultados.append({
+                "nome": nome,
+                "tamanho": tamanho,
+                "unidade": unidade,
+                "tempo_s": mediana,
+                "tempo_min_s": min(tempos),
+                "vazao_por_s": unidades / mediana,
+                "memoria_pico_bytes": pico,
+            })
+            print(f"{nome:38s} {tamanho:>10} {mediana * 1e3:10.2f} ms {unidades / mediana:14.4g} {unidade}/s "
+                  f"{pico / 2**20:9.2f} MiB", file=sys.stderr)
+    return {
+        "metadados": {
+            "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "processadores": os.cpu_count(),
+            "repeticoes": repeticoes,
+        },
+        "resultados": resultados,
+    }
+
+def comparar(atual, base, tolerancia=0.10, tolerancia_memoria=0.10):
+    """Lista (nome, tamanho, razão de tempo, razão de memória, regressão?) dos casos presentes nos dois arquivos."""
+    referencia = {(r["nome"], r["tamanho"]): r for r in base["resultados"]}
+    comparacoes = []
+    for r in atual["resultados"]:
+        b = referencia.get((r["nome"], r["tamanho"]))
+        if b is None:
+            continue
+        razao_tempo = r["tempo_s"] / b["tempo_s"]
+        razao_memoria = r["memoria_pico_bytes"] / max(b["memoria_pico_bytes"], 1)
+        regressao = razao_tempo > 1 + tolerancia or razao_memoria > 1 + tolerancia_memoria
+        comparacoes.append((r["nome"], r["tamanho"], razao_tempo, razao_memoria, regressao))
+    return comparacoes
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks dos caminhos críticos de cálculo.")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    executar = subparsers.add_parser("executar", help="Roda os benchmarks e grava o resultado em JSON")
+    executar.add_argument("--saida", default="desempenho.json")
+    executar.add_argument("--filtro", default=None, help="Roda apenas os casos cujo nome contém este texto")
+    executar.add_argument("--repeticoes", type=int, default=3)
+
+    comparar_parser = subparsers.add_parser("comparar", help="Compara um resultado com a linha de base")
+    comparar_parser.add_argument("atual")
+    comparar_parser.add_argument("--base", required=True)
+    comparar_parser.add_argument("--tolerancia", type=float, default=0.10, help="Aumento de tempo tolerado (0.10 = 10%%)")
+    comparar_parser.add_argument("--tolerancia-memoria", type=float, default=0.10)
+
+    args = parser.parse_args(argv)
+    if args.comando == "executar":
+        relatorio = executar_benchmarks(args.filtro, args.repeticoes)
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+        print(f"Resultados gravados em {args.saida}")
+        return 0
+
+    with open(args.atual, encoding="utf-8") as arquivo:
+        atual = json.load(arquivo)
+    with open(args.base, encoding="utf-8") as arquivo:
+        base = json.load(arquivo)
+    comparacoes = comparar(atual, base, args.tolerancia, args.tolerancia_memoria)
+    for nome, tamanho, razao_tempo, razao_memoria, regressao in comparacoes:
+        marca = "REGRESSÃO" if regressao else "ok"
+        print(f"{nome:38s} {tamanho:>10} tempo ×{razao_tempo:5.2f}  memória ×{razao_memoria:5.2f}  {marca}")
+    regressoes = sum(regressao for *_, regressao in comparacoes)
+    print(f"\n{regressoes} regressões em {len(comparacoes)} casos comparados")
+    return 1 if regressoes else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
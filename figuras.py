@@ -0,0 +1,83 @@
+"""Construção de figuras Plotly com payload enxuto.
+
+O Plotly (6 ou mais recente) serializa arrays do NumPy como buffers binários tipados
+(`{"dtype": "f4", "bdata": ...}`) em vez de listas de números em JSON. As funções daqui garantem que
+os dados cheguem como arrays, em float32 quando isso não se nota na tela, e:
+
+- usam `Scattergl` (WebGL) nas dispersões 2D a partir de `LIMIAR_WEBGL` pontos. Abaixo disso, `Scatter`
+  evita ocupar mais um contexto WebGL, que os navegadores limitam por página;
+- só reduzem um array a float32 quando o passo do float32 no maior valor é pequeno perto da faixa
+  desenhada (`PRECISAO_VISUAL`); uma superfície 1e6 + 0.01·sin(...) continua em float64;
+- mandam x e y das superfícies como eixos 1D quando vêm de um `meshgrid`, e z em float32;
+- medem o payload de cada figura (`tamanho_payload`).
+
+O Plotly é importado dentro das funções, como no restante do aplicativo.
+"""
+import numpy as np
+
+from resultados import cabe_em_float32, compactar
+
+LIMIAR_WEBGL = 1000  # Pontos a partir dos quais uma dispersão 2D passa a usar WebGL
+PRECISAO_VISUAL = 1e-4  # Maior passo do float32 aceito, como fração da faixa (máximo - mínimo) dos valores
+
+def visivel_em_float32(valores):
+    """Indica se os valores ficam indistinguíveis na tela em float32: o erro é medido contra a faixa desenhada."""
+    finitos = valores[np.isfinite(valores)]
+    if finitos.size == 0:
+        return True
+    if not cabe_em_float32(finitos):
+        return False
+    faixa = float(finitos.max()) - float(finitos.min())
+    passo = float(np.spacing(np.float32(np.abs(finitos).max())))
+    return faixa == 0 or passo <= PRECISAO_VISUAL * faixa
+
+def array_binario(valores):
+    """Valores numéricos como array do NumPy (float32 quando a diferença não aparece); textos e outros voltam como estão."""
+    if valores is None:
+        return None
+    array = np.asarray(valores)
+    if array.dtype.kind in "iub":
+        return array
+    if array.dtype.kind == "f":
+        return compactar(array, visivel_em_float32(array))
+    return valores
+
+def eixos_malha(X, Y):
+    """Eixos 1D de uma malha de `meshgrid`; malhas irregulares voltam inteiras."""
+    X, Y = np.asarray(X), np.asarray(Y)
+    if X.ndim == 2 and np.array_equal(X, np.broadcast_to(X[:1], X.shape)) and np.array_equal(Y, np.broadcast_to(Y[:, :1], Y.shape)):
+        return X[0], Y[:, 0]
+    return X, Y
+
+def superficie(z, x=None, y=None, **propriedades):
+    """`go.Surface` com z em float32 e eixos 1D quando possível."""
+    import plotly.graph_objects as go
+    if x is not None and y is not None:
+        x, y = eixos_malha(x, y)
+    return go.Surface(x=array_binario(x), y=array_binario(y), z=array_binario(z), **propriedades)
+
+def dispersao(x, y, **propriedades):
+    """Dispersão 2D: `Scattergl` a partir de `LIMIAR_WEBGL` pontos, `Scatter` abaixo disso."""
+    import plotly.graph_objects as go
+    tipo = go.Scattergl if len(x) >= LIMIAR_WEBGL else go.Scatter
+    return tipo(x=array_binario(x), y=array_binario(y), **propriedades)
+
+def dispersao_3d(x, y, z, **propriedades):
+    """`go.Scatter3d` (já desenhado em WebGL) com coordenadas binárias."""
+    import plotly.graph_objects as go
+    return go.Scatter3d(x=array_binario(x), y=array_binario(y), z=array_binario(z), **propriedades)
+
+def binarizar_figura(fig):
+    """Converte para arrays binários os dados numéricos dos traços de uma figura pronta (ex.: Plotly Express)."""
+    for traco in fig.data:
+        for atributo in ("x", "y", "z"):
+            if atributo in traco and traco[atributo] is not None:
+                traco[atributo] = array_binario(traco[atributo])
+        if "marker" in traco and traco.marker.size is not None and np.ndim(traco.marker.size):
+            traco.marker.size = array_binario(traco.marker.size)
+    return fig
+
+def tamanho_payload(fig):
+    """Bytes do JSON da figura, como enviado ao navegador."""
+    import plotly.io as pio
+    return len(pio.to_json(fig, validate=False).encode("utf-8"))
@@ -0,0 +1,95 @@
+"""Medição leve de tempo e contadores dos caminhos críticos.
+
+`etapa(nome, tipo)` cronometra um trecho e `contar(nome, valor)` soma contadores (passos, pontos de
+grade, marcadores, bytes enviados...). Sem uma medição ativa, ambos retornam imediatamente, então as
+chamadas podem ficar no código de produção. A medição ativa vive num `ContextVar`, isolada por
+sessão/thread do Streamlit.
+
+Com `UNIVERSO_AUREO_LOG_DESEMPENHO=1`, cada execução é medida e registrada como uma linha JSON no
+logger `universo_aureo.desempenho`.
+"""
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+logger = logging.getLogger("universo_aureo.desempenho")
+
+_medicao_ativa = ContextVar("medicao_ativa", default=None)
+
+class Medicao:
+    """Etapas cronometradas e contadores de uma execução de módulo."""
+
+    def __init__(self, modulo):
+        self.modulo = modulo
+        self.inicio = time.perf_counter()
+        self.etapas = []  # (nome, tipo, nível de aninhamento, duração em segundos)
+        self.contadores = {}
+        self._nivel = 0
+
+    def total(self):
+        return time.perf_counter() - self.inicio
+
+    def como_dicionario(self):
+        return {
+            "modulo": self.modulo,
+            "total_s": self.total(),
+            "etapas": [
+                {"nome": nome, "tipo": tipo, "nivel": nivel, "duracao_s": duracao}
+                for nome, tipo, nivel, duracao in self.etapas
+            ],
+            "contadores": dict(self.contadores),
+        }
+
+    def como_json(self):
+        return json.dumps(self.como_dicionario(), ensure_ascii=False)
+
+def log_ativado():
+    return os.environ.get("UNIVERSO_AUREO_LOG_DESEMPENHO") == "1"
+
+def iniciar_medicao(modulo):
+    """Ativa uma nova medição no contexto atual e a retorna."""
+    medicao = Medicao(modulo)
+    _medicao_ativa.set(medicao)
+    return medicao
+
+def finalizar_medicao():
+    """Desativa a medição do contexto atual, registrando-a no log se ativado, e a retorna."""
+    medicao = _medicao_ativa.get()
+    _medicao_ativa.set(None)
+    if medicao is not None and log_ativado():
+        if not logging.getLogger().handlers and not logger.handlers:
+            logging.basicConfig(level=logging.INFO, format="%(message)s")
+        logger.setLevel(logging.INFO)
+        logger.info(medicao.como_json())
+    return medicao
+
+def medindo():
+    """Indica se há medição ativa; use para evitar contagens caras (ex.: serializar figuras) sem necessidade."""
+    return _medicao_ativa.get() is not None
+
+@contextmanager
+def etapa(nome, tipo="calculo"):
+    """Cronometra o bloco como uma etapa do tipo "calculo" ou "render"."""
+    medicao = _medicao_ativa.get()
+    if medicao is None:
+        yield
+        return
+    nivel = medicao._nivel
+    indice = len(medicao.etapas)
+    medicao.etapas.append((nome, tipo, nivel, 0.0))
+    medicao._nivel += 1
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        medicao._nivel -= 1
+        medicao.etapas[indice] = (nome, tipo, nivel, time.perf_counter() - inicio)
+
+def contar(nome, valor=1):
+    """Soma `valor` ao contador `nome` da medição ativa."""
+    medicao = _medicao_ativa.get()
+    if medicao is not None:
+        medicao.contadores[nome] = medicao.contadores.get(nome, 0) + valor
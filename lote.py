@@ -0,0 +1,210 @@
+"""Execução em lote (sem interface) das simulações do Universo Áureo.
+
+Lê um arquivo de cenários em JSON ou YAML, executa as mesmas funções de cálculo do aplicativo
+sem importar Streamlit, Folium ou Plotly e grava cada resultado em `.npz` comprimido.
+
+Exemplo de arquivo de cenários::
+
+    {
+        "cenarios": [
+            {"nome": "orbita_base", "modulo": "orbita",
+             "parametros": {"massa_bn": 1e31, "massa_planeta": 1e24, "perturbacao": 0.02, "num_passos": 1000}},
+            {"modulo": "odds",
+             "parametros": {"probabilidades": {"Erupção Solar": [2.5, 6.5]}, "valor_esperado": 3.0,
+                            "tempo_decorrido": 30, "eventos": 2}}
+        ]
+    }
+
+Os módulos estocásticos (`orbita`, `translacao`, `frequencias` e `odds` com `num_cenarios`) aceitam
+`"semente"` nos parâmetros: a mesma semente reproduz o mesmo resultado.
+
+Uso::
+
+    python lote.py cenarios.json --saida resultados/
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+from aproximacoes import indexar_encontros
+from calculos import (
+    aplicar_distorcao_espaco_tempo,
+    calcular_aplicacoes,
+    calcular_captacao_energia,
+    calcular_frequencias_aureas,
+    calcular_malha_distorcao,
+    calcular_orbita,
+    simular_monte_carlo_odds,
+    simular_translacao_planetas,
+)
+from resultados import compactar
+
+# ==================================================
+# Execução de cada módulo
+# ==================================================
+def executar_orbita(parametros):
+    """Órbita em torno de um buraco negro (Buracos Negros e Anomalias)."""
+    trajetoria, energia_orbita = calcular_orbita(
+        parametros["massa_bn"],
+        parametros["massa_planeta"],
+        parametros["perturbacao"],
+        num_passos=parametros.get("num_passos", 1000),
+        dt=parametros.get("dt", 0.05),
+        semente=parametros.get("semente"),
+    )
+    return {"trajetoria": trajetoria, "energia_orbita": energia_orbita}
+
+def executar_translacao(parametros):
+    """Translação dos planetas ao redor do astro central, com as colisões detectadas."""
+    trajetorias, colisoes = simular_translacao_planetas(
+        parametros["massa_astro_central"],
+        parametros["massas_planetas"],
+        parametros["distancias_planetas"],
+        parametros["tamanhos_planetas"],
+        parametros.get("modelo", "Clássico"),
+        num_passos=parametros.get("num_passos", 1000),
+        dt=parametros.get("dt", 0.05),
+        semente=parametros.get("semente"),
+    )
+    # Passos de colisão de todos os pares concatenados; `colisoes_inicio[k]` marca onde começa o par k
+    passos = [passos_par for _, _, passos_par in colisoes]
+    resultado = {
+        "trajetorias": np.stack(trajetorias),
+        "colisoes_pares": np.array([(i, j) for i, j, _ in colisoes], dtype=np.int64).reshape(-1, 2),
+        "colisoes_passos": np.concatenate(passos) if passos else np.zeros(0, dtype=np.int64),
+        "colisoes_inicio": np.cumsum([0] + [len(p) for p in passos])[:-1],
+    }
+    # Encontros contínuos abaixo do limiar (array estruturado: i, j, inicio, fim, instante_minimo, distancia_minima)
+    if "limiar_encontros" in parametros:
+        resultado["encontros"] = indexar_encontros(trajetorias, parametros["limiar_encontros"]).consultar()
+    return resultado
+
+def executar_malha_distorcao(parametros):
+    """Malha do tecido espaço-tempo distorcida (Sistema Planetário e Espaço-Tempo)."""
+    X, Y, Z = calcular_malha_distorcao(
+        parametros["massa_astro_central"],
+        parametros["massas_planetas"],
+        parametros["distancias_planetas"],
+        parametros.get("modelo", "Clássico"),
+        extensao=parametros.get("extensao", 2000),
+        resolucao=parametros.get("resolucao", 20),
+    )
+    return {"X": X, "Y": Y, "Z": Z}
+
+def executar_frequencias(parametros):
+    """Frequências Áureas e Territórios."""
+    return calcular_frequencias_aureas(
+        parametros.get("frequencia_alvo", 432),
+        parametros.get("alpha", 0.5),
+        parametros.get("harmonico_aureo", 3),
+        parametros.get("latitude", -23.5505),
+        parametros.get("longitude", -46.6333),
+        parametros.get("num_pontos", 100),
+        semente=parametros.get("semente", 42),
+    )
+
+def executar_energia(parametros):
+    """Captação e Transformação de Energia."""
+    return calcular_captacao_energia(
+        parametros.get("P", 200.0),
+        parametros.get("f_F", 50.0),
+        parametros.get("theta_F", 130.0),
+        parametros.get("R_l", 3.0),
+        parametros.get("alpha", -23.8),
+    )
+
+def executar_odds(parametros):
+    """Projeção das ODDS (Aplicações e Cálculo Infinito), com cenários Monte Carlo opcionais."""
+    probabilidades = {evento: tuple(faixa) for evento, faixa in parametros["probabilidades"].items()}
+    valor_esperado = parametros.get("valor_esperado", 3.0)
+    probabilidades_ajustadas = aplicar_distorcao_espaco_tempo(
+        probabilidades, parametros.get("tempo_decorrido", 0), parametros.get("eventos", 0)
+    )
+    aplicacoes = calcular_aplicacoes(probabilidades_ajustadas, valor_esperado)
+    eventos = list(probabilidades)
+    resultado = {
+        "eventos": np.array(eventos),
+        "prob_min_ajustada": np.array([probabilidades_ajustadas[evento][0] for evento in eventos]),
+        "prob_max_ajustada": np.array([probabilidades_ajustadas[evento][1] for evento in eventos]),
+        "aplicacoes": np.array([aplicacoes[evento] for evento in eventos]),
+    }
+    if "num_cenarios" in parametros:
+        quantis = tuple(parametros.get("quantis", (0.05, 0.25, 0.5, 0.75, 0.95)))
+        resultados_mc = simular_monte_carlo_odds(
+            probabilidades,
+            tuple(parametros.get("faixa_tempo", (0, 90))),
+            tuple(parametros.get("faixa_eventos", (0, 10))),
+            valor_esperado,
+            num_cenarios=parametros["num_cenarios"],
+            quantis=quantis,
+            nivel_confianca=parametros.get("nivel_confianca", 0.9),
+            semente=parametros.get("semente"),
+        )
+        resultado["mc_quantis_niveis"] = np.array(quantis)
+        resultado["mc_media"] = np.array([resultados_mc[evento]["media"] for evento in eventos])
+        resultado["mc_desvio"] = np.array([resultados_mc[evento]["desvio"] for evento in eventos])
+        resultado["mc_quantis"] = np.array([list(resultados_mc[evento]["quantis"].values()) for evento in eventos])
+        resultado["mc_banda"] = np.array([resultados_mc[evento]["banda"] for evento in eventos])
+    return resultado
+
+MODULOS = {
+    "orbita": executar_orbita,
+    "translacao": executar_translacao,
+    "malha_distorcao": executar_malha_distorcao,
+    "frequencias": executar_frequencias,
+    "energia": executar_energia,
+    "odds": executar_odds,
+}
+
+# ==================================================
+# Leitura de cenários e gravação de resultados
+# ==================================================
+def carregar_cenarios(caminho):
+    """Lê a lista de cenários de um arquivo JSON ou YAML."""
+    with open(caminho, encoding="utf-8") as arquivo:
+        if caminho.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit("Arquivos YAML exigem o pacote PyYAML (pip install pyyaml).")
+            conteudo = yaml.safe_load(arquivo)
+        else:
+            conteudo = json.load(arquivo)
+
+    if isinstance(conteudo, dict):
+        conteudo = conteudo.get("cenarios", [conteudo])
+    for cenario in conteudo:
+        if cenario.get("modulo") not in MODULOS:
+            raise SystemExit(f"Módulo desconhecido: {cenario.get('modulo')!r}. Opções: {', '.join(MODULOS)}")
+    return conteudo
+
+def executar_cenario(cenario, compacto=False):
+    """Executa um cenário e devolve o dicionário de arrays do resultado (em float32 se `compacto`)."""
+    resultado = MODULOS[cenario["modulo"]](cenario.get("parametros", {}))
+    return {nome: compactar(valor, compacto) for nome, valor in resultado.items()}
+
+def salvar_resultado(caminho, resultado):
+    """Grava o resultado em formato binário `.npz` comprimido."""
+    np.savez_compressed(caminho, **resultado)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Executa cenários do Universo Áureo sem a interface Streamlit.")
+    parser.add_argument("cenarios", help="Arquivo de cenários (.json, .yaml ou .yml)")
+    parser.add_argument("--saida", default="resultados", help="Diretório onde os arquivos .npz serão gravados")
+    parser.add_argument("--float32", action="store_true", help="Grava os arrays em float32 quando os valores cabem")
+    args = parser.parse_args(argv)
+
+    cenarios = carregar_cenarios(args.cenarios)
+    os.makedirs(args.saida, exist_ok=True)
+    for indice, cenario in enumerate(cenarios):
+        nome = cenario.get("nome", f"{indice:03d}_{cenario['modulo']}")
+        caminho = os.path.join(args.saida, f"{nome}.npz")
+        salvar_resultado(caminho, executar_cenario(cenario, args.float32))
+        print(f"{nome}: {caminho}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
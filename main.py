@@ -1,89 +1,164 @@
+import importlib
+import os
+import sys
+import threading
+import time
+
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
-from sklearn.ensemble import IsolationForest
-import folium
-from streamlit_folium import st_folium
+
+from calculos import (
+    ETAPAS_FREQUENCIAS_AUREAS,
+    ano_luz,
+    aplicar_distorcao_espaco_tempo,
+    calcular_aplicacoes,
+    calcular_captacao_energia,
+    calcular_distorcao_eventos,
+    calcular_orbita,
+    calcular_tensor_projecao,
+    distorcao_espaco_tempo,
+    gerador,
+    pipeline_frequencias_aureas,
+    pipeline_sistema_planetario,
+    projecao_do_tensor,
+    resultado_frequencias_aureas,
+    simular_monte_carlo_odds,
+)
+from figuras import binarizar_figura, dispersao, dispersao_3d, superficie, tamanho_payload
+from instrumentacao import contar, etapa, finalizar_medicao, iniciar_medicao, log_ativado, medindo
+from pipeline import impressao
+from resultados import compactar, criar_registros, exportar_csv, exportar_npz, exportar_parquet
 
 # ==================================================
-# Constantes Físicas
+# Dependências Carregadas Sob Demanda
 # ==================================================
-c = 3e8  # Velocidade da luz em m/s
-G = 6.67430e-11  # Constante gravitacional em m^3 kg^-1 s^-2
-ano_luz = 9.461e15  # Distância que a luz percorre em um ano (em metros)
-h = 6.626e-34  # Constante de Planck (J·s)
-e = 1.602e-19  # Carga do elétron (C)
-phi = 1.61803398875  # Proporção áurea
+# pandas, matplotlib, plotly, folium e scikit-learn são importados dentro das funções que os usam;
+# aqui fica o que cada módulo precisa, para carregar (e cronometrar) apenas o módulo escolhido.
+DEPENDENCIAS_MODULOS = {
+    "Buracos Negros e Anomalias": ["matplotlib.pyplot", "plotly.graph_objects"],
+    "Captação e Transformação de Energia": ["matplotlib.pyplot", "plotly.graph_objects"],
+    "Sistema Planetário e Espaço-Tempo": ["matplotlib.pyplot", "plotly.graph_objects"],
+    "Frequências Áureas e Territórios": ["matplotlib.pyplot", "plotly.graph_objects", "folium", "streamlit_folium", "sklearn.ensemble"],
+    "Aplicações e Cálculo Infinito": ["pandas", "matplotlib.pyplot", "plotly.express"],
+    "Ajuda e Orientação": ["matplotlib.pyplot"],
+}
+
+@st.cache_resource(show_spinner=False)
+def tempos_importacao():
+    """Tempo da primeira importação de cada dependência neste processo do servidor (segundos)."""
+    return {}
+
+def carregar_dependencias(nomes):
+    """Importa as dependências ainda não carregadas, registrando quanto cada uma levou."""
+    tempos = tempos_importacao()
+    for nome in nomes:
+        if nome not in sys.modules:
+            inicio = time.perf_counter()
+            importlib.import_module(nome)
+            tempos[nome] = time.perf_counter() - inicio
+
+@st.cache_resource(show_spinner=False)
+def preaquecer_dependencias():
+    """Importa em segundo plano as dependências de todos os módulos, uma vez por processo do servidor."""
+    todas = list(dict.fromkeys(nome for nomes in DEPENDENCIAS_MODULOS.values() for nome in nomes))
+    thread = threading.Thread(target=carregar_dependencias, args=(todas,), name="preaquecimento", daemon=True)
+    thread.start()
+    return thread
+
+def exibir_tempos_importacao():
+    """Relatório de tempo de importação na barra lateral."""
+    tempos = tempos_importacao()
+    with st.sidebar.expander("⏱️ Tempo de Importação"):
+        if not tempos:
+            st.write("Nenhuma dependência importada sob demanda ainda.")
+        for nome, segundos in sorted(tempos.items(), key=lambda item: item[1], reverse=True):
+            st.write(f"`{nome}`: {segundos * 1e3:.0f} ms")
 
 # ==================================================
-# Funções de Cálculo
+# Painel de Desempenho
 # ==================================================
-def calcular_frequencias(frequencia_alvo, harmonico_aureo):
-    """Calcula frequências harmônicas áureas."""
-    return [frequencia_alvo * (1 + 0.61803398875)**i for i in range(harmonico_aureo)]
-
-def detectar_anomalias_isolation_forest(dados):
-    """Detecta anomalias usando Isolation Forest."""
-    iso_forest = IsolationForest(contamination=0.05, random_state=42)
-    anomalias = iso_forest.fit_predict(dados)
-    return anomalias == -1  # Retorna True para anomalias
-
-def distorcao_espaco_tempo(massa, distancia, modelo):
-    """Calcula a distorção do espaço-tempo com base no modelo escolhido."""
-    if modelo == "Clássico":
-        return (2 * G * massa) / (c**2 * distancia)
-    elif modelo == "Fluxo Matemático":
-        return (2 * G * massa) / (c**2 * distancia) * np.exp(-distancia / (1e9 * ano_luz))
-    else:
-        return 0
-
-def calcular_orbita(massa_bn, massa_planeta, perturbacao, num_passos=1000, dt=0.05):
-    """Simula a órbita de um planeta em torno de um buraco negro."""
-    posicao = np.array([1.0, 0.0])
-    velocidade = np.array([0.0, 1.0])
-    trajetoria = []
-    energia_orbita = []
-    
-    for _ in range(num_passos):
-        r = np.linalg.norm(posicao)
-        aceleracao = -G * massa_bn / r**3 * posicao + perturbacao * np.random.normal(0, 1, 2)
-        velocidade += aceleracao * dt
-        posicao += velocidade * dt
-        trajetoria.append(posicao.copy())
-        energia_orbita.append(0.5 * massa_planeta * np.linalg.norm(velocidade)**2 - G * massa_bn * massa_planeta / r)
-    
-    return np.array(trajetoria), np.array(energia_orbita)
-
-def calcular_colisao_asteroide(distancias_planetas, rotacoes_planetas, tamanhos_planetas):
-    """Simula a possibilidade de colisão de asteroides com os planetas."""
-    colisoes = []
-    for i in range(len(distancias_planetas)):
-        # Simulação simples: colisão se o asteroide estiver dentro do raio do planeta
-        raio_planeta = tamanhos_planetas[i] * ano_luz
-        colisoes.append(np.random.random() < 0.1)  # 10% de chance de colisão (exemplo)
-    return colisoes
-
-def aplicar_distorcao_espaco_tempo(probabilidades, tempo_decorrido, eventos, tempo_total=90):
-    """Ajusta as probabilidades com base no tempo decorrido e nos eventos."""
-    probabilidades_ajustadas = {}
-    for evento, (prob_min, prob_max) in probabilidades.items():
-        fator_correcao = 1 + (tempo_decorrido / tempo_total) * (np.mean([prob_min, prob_max]) / prob_min)
-        fator_evento = 1 + (eventos * 0.05)  # Cada evento influencia a probabilidade em 5%
-        probabilidades_ajustadas[evento] = (prob_min * fator_correcao * fator_evento, prob_max * fator_correcao * fator_evento)
-    return probabilidades_ajustadas
+def contar_bytes_figura(fig):
+    """Soma o payload da figura Plotly aos bytes enviados e ao contador da própria figura (só durante uma medição)."""
+    if medindo():
+        tamanho = tamanho_payload(fig)
+        contar("bytes_enviados", tamanho)
+        contar(f"bytes_figura:{fig.layout.title.text or 'sem título'}", tamanho)
+
+def exibir_painel_desempenho(medicao):
+    """Painel "Desempenho" na barra lateral com as etapas cronometradas e os contadores desta execução."""
+    dados = medicao.como_dicionario()
+    with st.sidebar.expander("📈 Desempenho", expanded=True):
+        st.write(f"**Total da execução:** {dados['total_s'] * 1e3:.1f} ms")
+        linhas = ["| Etapa | Tipo | ms |", "|---|---|---:|"]
+        for item in dados["etapas"]:
+            linhas.append(f"| {'↳ ' * item['nivel']}{item['nome']} | {item['tipo']} | {item['duracao_s'] * 1e3:.1f} |")
+        st.markdown("\n".join(linhas))
+        for nome, valor in dados["contadores"].items():
+            st.write(f"**{nome}:** {valor:,}")
+        st.download_button(
+            "Baixar Medições (JSON)",
+            medicao.como_json(),
+            file_name="desempenho.json",
+            mime="application/json",
+            key="download_desempenho"
+        )
+
+# ==================================================
+# Sementes Aleatórias
+# ==================================================
+# Um fluxo por cálculo estocástico, todos derivados da semente da barra lateral por `spawn_key`
+FLUXOS_ALEATORIOS = (
+    "orbita",
+    "colisao_asteroide",
+    "translacao_planetas",
+    "frequencias_aureas",
+    "distorcao_gravitacional_3d",
+    "distorcao_eventos",
+    "ajuda_orientacao",
+    "monte_carlo_odds",
+)
+
+def semente_fluxo(nome):
+    """SeedSequence do fluxo `nome`: reproduzível para a semente da sessão e independente dos demais fluxos."""
+    return np.random.SeedSequence(st.session_state.get("semente_aleatoria", 42), spawn_key=(FLUXOS_ALEATORIOS.index(nome),))
+
+# ==================================================
+# Pipelines Memoizados
+# ==================================================
+def pipeline_da_sessao(nome, criar):
+    """Pipeline guardado na sessão, para que cada nova execução reaproveite as etapas da anterior."""
+    if nome not in st.session_state:
+        st.session_state[nome] = criar()
+    return st.session_state[nome]
+
+# ==================================================
+# Exportação de Resultados
+# ==================================================
+def armazenamento_compacto():
+    """Indica se a opção de armazenamento em float32 está marcada na barra lateral."""
+    return st.session_state.get("armazenamento_compacto", False)
+
+def botoes_exportacao(registros, nome_arquivo, rotulo_csv, chave):
+    """Botões de download em CSV, .npz e Parquet; cada arquivo só é gerado quando o seu botão é clicado."""
+    contar("bytes_resultados", registros.nbytes)
+    st.download_button(rotulo_csv, lambda: exportar_csv(registros), file_name=f"{nome_arquivo}.csv", mime="text/csv", key=chave)
+    st.download_button("Baixar em NumPy (.npz)", lambda: exportar_npz(registros), file_name=f"{nome_arquivo}.npz",
+                       mime="application/octet-stream", key=f"{chave}_npz")
+    st.download_button("Baixar em Parquet", lambda: exportar_parquet(registros), file_name=f"{nome_arquivo}.parquet",
+                       mime="application/vnd.apache.parquet", key=f"{chave}_parquet")
 
+# ==================================================
+# Funções de Visualização
+# ==================================================
 def plotar_campo_magnetico(distancias_planetas, campo_magnetico):
     import plotly.graph_objects as go
     import streamlit as st
 
     fig = go.Figure()
 
-    fig.add_trace(go.Scatter(
-        x=distancias_planetas,
-        y=campo_magnetico,
+    fig.add_trace(dispersao(
+        distancias_planetas,
+        campo_magnetico,
         mode='lines+markers',
         name='Oscilação do Campo Magnético',
         line=dict(color='royalblue', width=2)
@@ -96,26 +171,12 @@ def plotar_campo_magnetico(distancias_planetas, campo_magnetico):
         template='plotly_dark'
     )
 
+    contar_bytes_figura(fig)
     st.plotly_chart(fig, use_container_width=True)
 
-def energia_quantica_fluxo(frequencia):
-    """Calcula a energia quântica de um fóton: E = h * f."""
-    return h * frequencia
-
-def tensao_fluxo(energia):
-    """Calcula a tensão equivalente: V = E / e."""
-    return energia / e
-
-def calcular_campo_magnetico(distancias_planetas, massas_planetas):
-    """Calcula as oscilações do campo magnético."""
-    campo_magnetico = []
-    for i in range(len(distancias_planetas)):
-        # Simulação simples: campo magnético proporcional à massa e inversamente proporcional à distância
-        campo_magnetico.append(massas_planetas[i] / distancias_planetas[i])
-    return campo_magnetico
-
 def grafico_escala_galaxia(df_resultados):
     """Gráfico 3D para representar eventos em escala galáctica."""
+    import plotly.express as px
     # Adiciona uma coluna de probabilidade ajustada ao DataFrame
     df_resultados["Probabilidade Ajustada"] = df_resultados["Valor de Aplicação"] * 0.1  # Exemplo de cálculo
 
@@ -129,13 +190,13 @@ def grafico_escala_galaxia(df_resultados):
         title="Eventos Cósmicos em Escala Galáctica",
         labels={"Valor de Aplicação": "Impacto", "Probabilidade Ajustada": "Probabilidade"}
     )
+    binarizar_figura(fig)
+    contar_bytes_figura(fig)
     st.plotly_chart(fig)
 
-# ==================================================
-# Funções de Visualização
-# ==================================================
 def plotar_orbita(trajetoria):
     """Plota a trajetória da órbita em 2D."""
+    import matplotlib.pyplot as plt
     fig, ax = plt.subplots()
     ax.plot(trajetoria[:, 0], trajetoria[:, 1], label="Órbita")
     ax.set_xlabel("X (anos-luz)")
@@ -146,9 +207,10 @@ def plotar_orbita(trajetoria):
 
 def plotar_orbita_3d(trajetoria):
     """Plota a trajetória da órbita em 3D."""
+    import plotly.graph_objects as go
     z = np.linspace(0, 10, len(trajetoria))  # Simulação de altura ao longo do tempo
-    fig = go.Figure(data=[go.Scatter3d(
-        x=trajetoria[:, 0], y=trajetoria[:, 1], z=z,
+    fig = go.Figure(data=[dispersao_3d(
+        trajetoria[:, 0], trajetoria[:, 1], z,
         mode='lines',
         line=dict(color='blue', width=2),
     )])
@@ -161,10 +223,12 @@ def plotar_orbita_3d(trajetoria):
         ),
         margin=dict(l=0, r=0, b=0, t=30)
     )
+    contar_bytes_figura(fig)
     st.plotly_chart(fig)
 
 def plotar_energia(energia_orbita):
     """Plota a energia ao longo da órbita."""
+    import matplotlib.pyplot as plt
     fig, ax = plt.subplots()
     ax.plot(energia_orbita, label="Energia Orbital")
     ax.set_xlabel("Passo de Tempo")
@@ -175,6 +239,7 @@ def plotar_energia(energia_orbita):
 
 def plotar_energia_tempo(tempo, energia, titulo="Energia Armazenada"):
     """Plota a energia ao longo do tempo."""
+    import matplotlib.pyplot as plt
     fig, ax = plt.subplots()
     ax.plot(tempo, energia, label=titulo, color='green')
     ax.set_xlabel("Tempo (s)")
@@ -185,7 +250,8 @@ def plotar_energia_tempo(tempo, energia, titulo="Energia Armazenada"):
 
 def plotar_fluxo_3d(X, Y, Z, titulo="Fluxo de Energia no Espaço-Tempo"):
     """Plota o fluxo de energia em 3D."""
-    fig = go.Figure(data=[go.Surface(x=X, y=Y, z=Z, colorscale="Viridis", opacity=0.7)])
+    import plotly.graph_objects as go
+    fig = go.Figure(data=[superficie(Z, X, Y, colorscale="Viridis", opacity=0.7)])
     fig.update_layout(
         title=titulo,
         scene=dict(
@@ -195,6 +261,7 @@ def plotar_fluxo_3d(X, Y, Z, titulo="Fluxo de Energia no Espaço-Tempo"):
         ),
         margin=dict(l=0, r=0, b=0, t=30)
     )
+    contar_bytes_figura(fig)
     st.plotly_chart(fig)
     
 def plotar_colisoes_asteroides(distancias_planetas, colisoes):
@@ -214,14 +281,15 @@ def plotar_colisoes_asteroides(distancias_planetas, colisoes):
 
 def plotar_distorcao_espaco_tempo(X, Y, Z, astro_central, planetas, modelo):
     """Plota a distorção do espaço-tempo em 3D."""
+    import plotly.graph_objects as go
     fig = go.Figure()
     
     # Malha do espaço-tempo
-    fig.add_trace(go.Surface(x=X, y=Y, z=Z, colorscale="Blues", opacity=0.7, name="Distorção do Espaço-Tempo"))
+    fig.add_trace(superficie(Z, X, Y, colorscale="Blues", opacity=0.7, name="Distorção do Espaço-Tempo"))
     
     # Astro Central
-    fig.add_trace(go.Scatter3d(
-        x=[0], y=[0], z=[-distorcao_espaco_tempo(astro_central["massa"], astro_central["tamanho"] * ano_luz, modelo)],
+    fig.add_trace(dispersao_3d(
+        [0.0], [0.0], [-distorcao_espaco_tempo(astro_central["massa"], astro_central["tamanho"] * ano_luz, modelo)],
         mode="markers",
         marker=dict(size=20, color="black", opacity=0.8),
         name="Astro Central"
@@ -229,8 +297,8 @@ def plotar_distorcao_espaco_tempo(X, Y, Z, astro_central, planetas, modelo):
     
     # Planetas
     for i, planeta in enumerate(planetas):
-        fig.add_trace(go.Scatter3d(
-            x=[planeta["distancia"]], y=[0], z=[-distorcao_espaco_tempo(planeta["massa"], planeta["tamanho"] * ano_luz, modelo)],
+        fig.add_trace(dispersao_3d(
+            [planeta["distancia"]], [0.0], [-distorcao_espaco_tempo(planeta["massa"], planeta["tamanho"] * ano_luz, modelo)],
             mode="markers",
             marker=dict(size=10, color="red", opacity=0.8),
             name=f"Planeta {i+1}"
@@ -348,52 +416,38 @@ def modulo_buracos_negros():
     )
 
     if st.button("Simular Órbita", key="simular_orbita"):
-        trajetoria, energia_orbita = calcular_orbita(massa_bn, massas_planetas[0], perturbacao, num_passos=num_passos, dt=0.05)
+        with etapa("calcular_orbita"):
+            trajetoria, energia_orbita = calcular_orbita(massa_bn, massas_planetas[0], perturbacao, num_passos=num_passos, dt=0.05,
+                                                         semente=semente_fluxo("orbita"))
+        compacto = armazenamento_compacto()
+        trajetoria = compactar(trajetoria, compacto)
+        energia_orbita = compactar(energia_orbita, compacto)
         
         # Exibir gráficos
         st.subheader("Trajetória da Órbita 2D")
-        plotar_orbita(trajetoria)
+        with etapa("plotar_orbita", "render"):
+            plotar_orbita(trajetoria)
         
         st.subheader("Trajetória da Órbita 3D")
-        plotar_orbita_3d(trajetoria)
+        with etapa("plotar_orbita_3d", "render"):
+            plotar_orbita_3d(trajetoria)
         
         st.subheader("Energia ao Longo da Órbita")
-        plotar_energia(energia_orbita)
+        with etapa("plotar_energia", "render"):
+            plotar_energia(energia_orbita)
 
         # Exportação de Resultados de Energia
-        resultados_energia = pd.DataFrame({
+        resultados_energia = criar_registros({
             "Passo de Tempo": np.arange(num_passos),
             "Energia Orbital (J)": energia_orbita
-        })
-        csv_energia = resultados_energia.to_csv(index=False)
-        st.download_button(
-            "Baixar Resultados de Energia (CSV)", 
-            csv_energia, 
-            file_name="resultados_energia.csv", 
-            key="download_energia"
-        )
+        }, compacto)
+        botoes_exportacao(resultados_energia, "resultados_energia", "Baixar Resultados de Energia (CSV)", "download_energia")
     else:
         st.warning("Nenhuma simulação de órbita foi executada. Clique em 'Simular Órbita' para gerar resultados.")
 
 # ==================================================
 # Módulo 2: Captação e Transformação de Energia
 # ==================================================
-def corrente_fluxo(P, V_F, theta_F):
-    """Calcula a corrente em fluxo: I = P / (V_F * cos(theta_F))."""
-    return P / (V_F * np.cos(np.radians(theta_F)))
-
-def energia_perdida(E_F, alpha, R_l):
-    """Calcula a energia perdida: E_p = E_F * alpha * R_l."""
-    return E_F * alpha * R_l
-
-def energia_singularidade(E_F, alpha, R_l):
-    """Calcula a energia em singularidade: E_singularidade = E_F * (1 + alpha) / R_l."""
-    return E_F * (1 + alpha) / R_l
-
-def bobina_aurea(f_F, R_l):
-    """Calcula a energia captada pela bobina áurea."""
-    return (0.5 * 1e-3 * (f_F / R_l)**2)
-
 def modulo_captacao_energia():
     """Módulo principal para captação e transformação de energia."""
     st.header("Captação e Transformação de Energia")
@@ -415,11 +469,16 @@ def modulo_captacao_energia():
     alpha = st.sidebar.number_input("Fator de Ajuste (α)", value=-23.8, min_value=-100.0, max_value=100.0, key="fator_ajuste")
     
     # Cálculos de energia
-    E_F = energia_quantica_fluxo(f_F)
-    V_F = tensao_fluxo(E_F)
-    I_F = corrente_fluxo(P, V_F, theta_F)
-    E_p = energia_perdida(E_F, alpha, R_l)
-    E_singularidade = energia_singularidade(E_F, alpha, R_l)
+    with etapa("calcular_captacao_energia"):
+        captacao = calcular_captacao_energia(P, f_F, theta_F, R_l, alpha)
+    compacto = armazenamento_compacto()
+    captacao = {nome: compactar(valor, compacto) if np.ndim(valor) else valor for nome, valor in captacao.items()}
+    contar("pontos_de_grade", captacao["Z"].size)
+    E_F = captacao["E_F"]
+    V_F = captacao["V_F"]
+    I_F = captacao["I_F"]
+    E_p = captacao["E_p"]
+    E_singularidade = captacao["E_singularidade"]
     
     # Exibição dos resultados
     st.write(f"**Energia Quântica no Fluxo (E_F):** {E_F:.5e} J")
@@ -429,21 +488,17 @@ def modulo_captacao_energia():
     st.write(f"**Energia em Singularidade (E_singularidade):** {E_singularidade:.5e} J")
     
     # Gráfico de energia ao longo do tempo
-    tempo = np.linspace(0, 0.1, 1000)
-    energia_armazenada = (0.5 * 1e-3 * I_F**2) * (1 + alpha) * np.sin(2 * np.pi * f_F * tempo)
-    plotar_energia_tempo(tempo, energia_armazenada, "Energia Armazenada (J)")
+    with etapa("plotar_energia_tempo", "render"):
+        plotar_energia_tempo(captacao["tempo"], captacao["energia_armazenada"], "Energia Armazenada (J)")
     
     # Visualização 3D do fluxo de energia
     st.subheader("Visualização 3D do Fluxo de Energia")
-    x = np.linspace(-10, 10, 20)
-    y = np.linspace(-10, 10, 20)
-    X, Y = np.meshgrid(x, y)
-    Z = np.sin(np.sqrt(X**2 + Y**2)) * I_F  # Simulação de um campo de energia
-    plotar_fluxo_3d(X, Y, Z, "Fluxo de Energia no Espaço-Tempo")
+    with etapa("plotar_fluxo_3d", "render"):
+        plotar_fluxo_3d(captacao["X"], captacao["Y"], captacao["Z"], "Fluxo de Energia no Espaço-Tempo")
     
     # Bobina Áurea
     st.subheader("Bobina Áurea")
-    energia_bobina = bobina_aurea(f_F, R_l)
+    energia_bobina = captacao["energia_bobina"]
     st.write(f"**Energia Captada pela Bobina Áurea:** {energia_bobina:.5e} J")
     
     # Exportação de Resultados
@@ -455,54 +510,11 @@ def modulo_captacao_energia():
         "Energia em Singularidade (E_singularidade)": [E_singularidade],
         "Energia Captada pela Bobina Áurea": [energia_bobina]
     }
-    df = pd.DataFrame(resultados)
-    
-    # Botão para baixar CSV
-    st.download_button(
-        label="Baixar Resultados em CSV",
-        data=df.to_csv(index=False).encode('utf-8'),
-        file_name="resultados_energia.csv",
-        mime="text/csv",
-        key="download_resultados_energia"
-    )
-
-def simular_translacao_planetas(massa_astro_central, massas_planetas, distancias_planetas, tamanhos_planetas, modelo, num_passos=1000, dt=0.05):
-    """Simula o movimento de translação dos planetas ao redor do astro central."""
-    trajetorias = []
-    colisoes = []  # Armazenar informações sobre colisões
-    
-    for i in range(len(massas_planetas)):
-        # Posição inicial do planeta (distância no eixo X)
-        posicao = np.array([distancias_planetas[i], 0.0])
-        velocidade = np.array([0.0, np.sqrt(G * massa_astro_central / distancias_planetas[i])])  # Velocidade orbital inicial
-        trajetoria = []
-        
-        for _ in range(num_passos):
-            r = np.linalg.norm(posicao)
-            aceleracao = -G * massa_astro_central / r**3 * posicao  # Aceleração gravitacional
-            
-            # Aplicar perturbação no modelo de fluxo matemático
-            if modelo == "Fluxo Matemático":
-                aceleracao += np.random.normal(0, 1e-6, 2)  # Perturbação aleatória
-            
-            velocidade += aceleracao * dt
-            posicao += velocidade * dt
-            trajetoria.append(posicao.copy())
-        
-        trajetorias.append(np.array(trajetoria))
-    
-    # Verificar colisões entre planetas
-    for i in range(len(trajetorias)):
-        for j in range(i + 1, len(trajetorias)):
-            distancias = np.linalg.norm(trajetorias[i] - trajetorias[j], axis=1)
-            raio_total = tamanhos_planetas[i] + tamanhos_planetas[j]
-            if np.any(distancias < raio_total):
-                colisoes.append((i, j, np.where(distancias < raio_total)[0]))
-    
-    return trajetorias, colisoes
+    botoes_exportacao(criar_registros(resultados, compacto), "resultados_energia", "Baixar Resultados em CSV", "download_resultados_energia")
 
 def plotar_translacao_planetas(trajetorias, colisoes, tamanhos_planetas):
     """Plota as trajetórias dos planetas ao redor do astro central e destaca colisões."""
+    import matplotlib.pyplot as plt
     fig, ax = plt.subplots()
     for i, trajetoria in enumerate(trajetorias):
         ax.plot(trajetoria[:, 0], trajetoria[:, 1], label=f"Planeta {i+1}")
@@ -558,63 +570,104 @@ def modulo_sistema_planetario():
         rotacoes_planetas.append(rotacao_planeta)
         translacoes_planetas.append(translacao_planeta)
     
-    # Criando a malha do tecido espaço-tempo
-    x = np.linspace(-2000, 2000, 20)
-    y = np.linspace(-2000, 2000, 20)
-    X, Y = np.meshgrid(x, y)
-    Z = np.zeros_like(X)
-    
-    # Aplicando a distorção gravitacional
-    for i in range(X.shape[0]):
-        for j in range(X.shape[1]):
-            r_astro_central = np.sqrt(X[i, j]**2 + Y[i, j]**2)
-            Z[i, j] -= distorcao_espaco_tempo(massa_astro_central, r_astro_central * ano_luz, modelo)
-            for k in range(num_planetas):
-                r_planeta = np.sqrt((X[i, j] - distancias_planetas[k])**2 + Y[i, j]**2)
-                Z[i, j] -= distorcao_espaco_tempo(massas_planetas[k], r_planeta * ano_luz, modelo)
+    # Criando a malha do tecido espaço-tempo com a distorção gravitacional
+    # Só as etapas cujas entradas mudaram são refeitas: alterar uma rotação não recalcula a malha
+    pipeline = pipeline_da_sessao("pipeline_sistema_planetario", pipeline_sistema_planetario)
+    parametros = dict(
+        massa_astro_central=massa_astro_central,
+        massas_planetas=tuple(massas_planetas),
+        distancias_planetas=tuple(distancias_planetas),
+        tamanhos_planetas=tuple(tamanhos_planetas),
+        rotacoes_planetas=tuple(rotacoes_planetas),
+        modelo=modelo,
+        semente_colisao=semente_fluxo("colisao_asteroide"),
+        semente_translacao=semente_fluxo("translacao_planetas"),
+    )
+    with etapa("calcular_malha_distorcao"):
+        X, Y, Z = pipeline.calcular(["malha"], **parametros)["malha"]
+    compacto = armazenamento_compacto()
+    X, Y, Z = (compactar(malha, compacto) for malha in (X, Y, Z))
     
     # Exibindo o gráfico 3D da distorção do espaço-tempo
     st.subheader("Distorção do Espaço-Tempo")
     fig_distorcao = plotar_distorcao_espaco_tempo(X, Y, Z, {"massa": massa_astro_central, "tamanho": tamanho_astro_central}, 
                                                  [{"massa": massas_planetas[i], "tamanho": tamanhos_planetas[i], "distancia": distancias_planetas[i]} for i in range(num_planetas)], modelo)
-    st.plotly_chart(fig_distorcao)
+    with etapa("plotly_distorcao", "render"):
+        contar_bytes_figura(fig_distorcao)
+        st.plotly_chart(fig_distorcao)
     
     # Simulação de colisão de asteroides
     st.subheader("Possibilidade de Colisão de Asteroides")
-    colisoes = calcular_colisao_asteroide(distancias_planetas, rotacoes_planetas, tamanhos_planetas)
-    plotar_colisoes_asteroides(distancias_planetas, colisoes)
+    colisoes = pipeline.calcular(["colisoes_asteroides"], **parametros)["colisoes_asteroides"]
+    with etapa("plotar_colisoes_asteroides", "render"):
+        plotar_colisoes_asteroides(distancias_planetas, colisoes)
     
     # Oscilações do campo magnético
     st.subheader("Oscilações do Campo Magnético")
-    campo_magnetico = calcular_campo_magnetico(distancias_planetas, massas_planetas)
-    plotar_campo_magnetico(distancias_planetas, campo_magnetico)
+    campo_magnetico = pipeline.calcular(["campo_magnetico"], **parametros)["campo_magnetico"]
+    with etapa("plotar_campo_magnetico", "render"):
+        plotar_campo_magnetico(distancias_planetas, campo_magnetico)
     
     # Simulação do movimento de translação
     st.subheader("Movimento de Translação dos Planetas")
     if st.button("Simular Translação", key="simular_translacao"):
-        trajetorias, colisoes = simular_translacao_planetas(massa_astro_central, massas_planetas, distancias_planetas, tamanhos_planetas, modelo)
-        plotar_translacao_planetas(trajetorias, colisoes, tamanhos_planetas)
+        with etapa("simular_translacao_planetas"):
+            trajetorias, colisoes = pipeline.calcular(["translacao"], **parametros)["translacao"]
+        trajetorias = [compactar(trajetoria, compacto) for trajetoria in trajetorias]
+        with etapa("plotar_translacao_planetas", "render"):
+            plotar_translacao_planetas(trajetorias, colisoes, tamanhos_planetas)
         
         # Exibir alerta de colisão
         if colisoes:
             st.warning("Colisão detectada entre planetas!")
         else:
             st.success("Nenhuma colisão detectada.")
+        # Impressão dos parâmetros simulados: os encontros só valem enquanto eles não mudarem
+        st.session_state["translacao_simulada"] = impressao(parametros)
+    
+    # Aproximações entre planetas: mínimos e encontros calculados de forma contínua entre os passos
+    if st.session_state.get("translacao_simulada") not in (None, impressao(parametros)):
+        st.session_state.pop("translacao_simulada")
+    if st.session_state.get("translacao_simulada") and num_planetas > 1:
+        st.subheader("Aproximações entre Planetas")
+        limiar_encontros = st.number_input("Limiar de Aproximação (anos-luz)", value=0.01, min_value=1e-9, format="%.6f",
+                                           key="limiar_encontros")
+        with etapa("indexar_encontros"):
+            indice = pipeline.calcular(["encontros"], **parametros, limiar_encontros=limiar_encontros)["encontros"]
+        passo_inicial, passo_final = st.slider("Intervalo de Passos", 0, indice.num_passos - 1, (0, indice.num_passos - 1),
+                                               key="intervalo_passos_encontros")
+        percentual = st.slider("Distância Máxima (% do limiar)", 1, 100, 100, key="distancia_encontros")
+        with etapa("consultar_encontros"):
+            encontros = indice.consultar(limiar_encontros * percentual / 100, passo_inicial, passo_final)
+        if len(encontros):
+            st.dataframe({
+                "Planeta A": encontros["i"] + 1,
+                "Planeta B": encontros["j"] + 1,
+                "Início (passo)": encontros["inicio"],
+                "Fim (passo)": encontros["fim"],
+                "Maior Aproximação (passo)": encontros["instante_minimo"],
+                "Distância Mínima (anos-luz)": encontros["distancia_minima"],
+            })
+        else:
+            st.info("Nenhum encontro abaixo dessa distância no intervalo de passos escolhido.")
     
     # Exportação de Resultados
-    resultados = pd.DataFrame({
+    resultados = criar_registros({
         "Corpo Celeste": ["Astro Central"] + [f"Planeta {i+1}" for i in range(num_planetas)],
         "Massa (kg)": [massa_astro_central] + massas_planetas,
         "Distorção do Espaço-Tempo": [distorcao_espaco_tempo(massa_astro_central, tamanho_astro_central * ano_luz, modelo)] + \
                                      [distorcao_espaco_tempo(massas_planetas[i], tamanhos_planetas[i] * ano_luz, modelo) for i in range(num_planetas)]
-    })
-    csv = resultados.to_csv(index=False)
-    st.download_button("Baixar Resultados (CSV)", csv, file_name="resultados_sistema_planetario.csv", key="download_resultados_sistema_planetario")
+    }, compacto)
+    botoes_exportacao(resultados, "resultados_sistema_planetario", "Baixar Resultados (CSV)", "download_resultados_sistema_planetario")
     
 # ==================================================
 # Módulo 4: Frequências Áureas e Territórios
 # ==================================================
 def modulo_frequencias_aureas():
+    import matplotlib.pyplot as plt
+    import plotly.graph_objects as go
+    import folium
+    from streamlit_folium import st_folium
     st.header("Frequências Áureas e Territórios")
     st.markdown("""
         Este módulo analisa as frequências harmônicas áureas em territórios, identificando desequilíbrios térmicos, energéticos e gravitacionais.
@@ -632,32 +685,26 @@ def modulo_frequencias_aureas():
     raio = st.sidebar.slider("Raio de Busca (km)", 1, 100, 10, key="raio_busca")
     num_pontos = st.sidebar.slider("Número de Pontos Térmicos", 10, 500, 100, key="num_pontos")
     
-    # Simulação de dados térmicos
-    np.random.seed(42)
-    latitudes = latitude + np.random.uniform(-0.1, 0.1, num_pontos)
-    longitudes = longitude + np.random.uniform(-0.1, 0.1, num_pontos)
-    temperaturas = np.random.uniform(20, 40, num_pontos)
-    desequilibrios = np.abs(temperaturas - np.mean(temperaturas))
-    
-    # Cálculo de frequências harmônicas áureas
-    frequencias = calcular_frequencias(frequencia_alvo, harmonico_aureo)
-    
-    # Simulação de sinal detectado
-    tempo = np.linspace(0, 0.1, num_pontos)
-    sinal_detectado = np.sum([np.sin(2 * np.pi * f * tempo) * np.exp(-0.1 * tempo) for f in frequencias], axis=0)
-    sinal_detectado /= np.max(np.abs(sinal_detectado))
-    
-    # Cálculo de energia e radiação
-    energia_armazenada = (0.5 * 1e-3 * sinal_detectado**2) * (1 + alpha)
-    radiacao_termica = 5.67e-8 * (temperaturas + 273.15)**4
-    
-    # Simulação da distorção da gravidade
-    M_equivalente = energia_armazenada / (c**2)
-    distorcao_gravidade = (2 * G * M_equivalente) / (c**2 * 1e-9)
-    
-    # Detectar anomalias com Isolation Forest
-    dados_anomalias = np.column_stack((desequilibrios, distorcao_gravidade, radiacao_termica, energia_armazenada))
-    anomalias = detectar_anomalias_isolation_forest(dados_anomalias)
+    # Simulação dos pontos térmicos, sinal, energia, radiação, distorção e anomalias
+    # Só as etapas cujas entradas mudaram são refeitas: alterar α não sorteia os pontos nem sintetiza o sinal de novo
+    pipeline = pipeline_da_sessao("pipeline_frequencias_aureas", pipeline_frequencias_aureas)
+    with etapa("calcular_frequencias_aureas"):
+        dados = resultado_frequencias_aureas(pipeline.calcular(
+            ETAPAS_FREQUENCIAS_AUREAS, frequencia_alvo=frequencia_alvo, alpha=alpha, harmonico_aureo=harmonico_aureo,
+            latitude=latitude, longitude=longitude, num_pontos=num_pontos, semente=semente_fluxo("frequencias_aureas")
+        ))
+    compacto = armazenamento_compacto()
+    dados = {nome: compactar(valor, compacto) for nome, valor in dados.items()}
+    latitudes = dados["latitudes"]
+    longitudes = dados["longitudes"]
+    temperaturas = dados["temperaturas"]
+    desequilibrios = dados["desequilibrios"]
+    frequencias = dados["frequencias"]
+    tempo = dados["tempo"]
+    energia_armazenada = dados["energia_armazenada"]
+    radiacao_termica = dados["radiacao_termica"]
+    distorcao_gravidade = dados["distorcao_gravidade"]
+    anomalias = dados["anomalias"]
     
     # Criando abas
     aba1, aba2, aba3, aba4, aba5 = st.tabs([
@@ -665,7 +712,7 @@ def modulo_frequencias_aureas():
     ])
     
     # Aba 1: Frequências e Desequilíbrios
-    with aba1:
+    with aba1, etapa("aba_frequencias_desequilibrios", "render"):
         st.subheader("Relação entre Frequências Harmônicas e Desequilíbrios Térmicos")
         ressonancia = np.array(frequencias) * alpha
         desequilibrios_ressonancia = desequilibrios[:len(ressonancia)]
@@ -680,7 +727,7 @@ def modulo_frequencias_aureas():
         st.pyplot(fig)
     
     # Aba 2: Energia e Radiação
-    with aba2:
+    with aba2, etapa("aba_energia_radiacao", "render"):
         st.subheader("Energia e Radiação Térmica")
         
         # Gráfico de energia armazenada
@@ -702,7 +749,7 @@ def modulo_frequencias_aureas():
         st.pyplot(fig)
     
     # Aba 3: Mapa Interativo
-    with aba3:
+    with aba3, etapa("aba_mapa_interativo", "render"):
         st.subheader("Mapa de Desequilíbrios e Anomalias")
         mapa = folium.Map(location=[latitude, longitude], zoom_start=12)
         
@@ -712,15 +759,20 @@ def modulo_frequencias_aureas():
             popup = f"Temperatura: {temp:.1f}°C<br>Desequilíbrio: {deseq:.1f}°C<br>Energia: {energia:.2f} J<br>Radiação: {radiacao:.2f} W/m²<br>Distorção: {distorcao:.2e} m/s²"
             folium.CircleMarker(location=[lat, lon], radius=6, color=cor, fill=True, fill_color=cor, fill_opacity=0.7, popup=popup).add_to(mapa)
         
-        st_folium(mapa)
+        contar("marcadores", len(latitudes))
+        if medindo():
+            contar("bytes_enviados", len(mapa.get_root().render()))
+        with etapa("st_folium", "render"):
+            st_folium(mapa)
     
     # Aba 4: Distorção Gravitacional
-    with aba4:
+    with aba4, etapa("aba_distorcao_gravitacional", "render"):
         st.subheader("Simulação de Distorção Gravitacional e Anomalias")
         
         # Visualização 3D da distorção gravitacional
-        fig = go.Figure(data=[go.Surface(z=np.random.rand(20, 20), colorscale='inferno')])
+        fig = go.Figure(data=[superficie(gerador(semente_fluxo("distorcao_gravitacional_3d")).random((20, 20)), colorscale='inferno')])
         fig.update_layout(title="Distorção Gravitacional 3D", scene=dict(xaxis_title="X", yaxis_title="Y", zaxis_title="Intensidade Gravitacional"))
+        contar_bytes_figura(fig)
         st.plotly_chart(fig)
         
         # Explicação dos valores críticos
@@ -732,7 +784,7 @@ def modulo_frequencias_aureas():
         """)
     
     # Aba 5: Desequilíbrios por Zona
-    with aba5:
+    with aba5, etapa("aba_desequilibrios_zona", "render"):
         st.subheader("Desequilíbrios por Zona e Catástrofes")
         st.markdown("""
             Esta aba mostra os desequilíbrios por zona, destacando áreas críticas onde podem ocorrer catástrofes como terremotos, furacões ou outros eventos.
@@ -757,10 +809,14 @@ def modulo_frequencias_aureas():
             popup = f"Desequilíbrio: {deseq:.1f}°C"
             folium.CircleMarker(location=[lat, lon], radius=6, color=cor, fill=True, fill_color=cor, fill_opacity=0.7, popup=popup).add_to(mapa_desequilibrios)
         
-        st_folium(mapa_desequilibrios)
+        contar("marcadores", len(latitudes))
+        if medindo():
+            contar("bytes_enviados", len(mapa_desequilibrios.get_root().render()))
+        with etapa("st_folium", "render"):
+            st_folium(mapa_desequilibrios)
     
     # Exportação de Resultados
-    resultados = pd.DataFrame({
+    resultados = criar_registros({
         "Latitude": latitudes,
         "Longitude": longitudes,
         "Temperatura (°C)": temperaturas,
@@ -769,22 +825,38 @@ def modulo_frequencias_aureas():
         "Radiação Térmica (W/m²)": radiacao_termica,
         "Distorção Gravitacional (m/s²)": distorcao_gravidade,
         "Anomalia": anomalias
-    })
-    csv = resultados.to_csv(index=False)
-    st.download_button("Baixar Resultados (CSV)", csv, file_name="resultados_frequencias_aureas.csv", key="download_resultados_frequencias_aureas")
+    }, compacto)
+    botoes_exportacao(resultados, "resultados_frequencias_aureas", "Baixar Resultados (CSV)", "download_resultados_frequencias_aureas")
     
 # ==================================================
 # Módulo 5: Aplicações e Cálculo Infinito
 # ==================================================
-def calcular_aplicacoes(probabilidades_ajustadas, valor_esperado):
-    """Calcula as aplicações com base nas probabilidades ajustadas e no valor esperado."""
-    aplicacoes = {}
-    for evento, (prob_min, prob_max) in probabilidades_ajustadas.items():
-        aplicacoes[evento] = valor_esperado * (prob_min + prob_max) / 2
-    return aplicacoes
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def tensor_projecao_em_cache(probabilidades):
+    """Tensor de projeção reconstruído apenas quando as probabilidades mudam."""
+    return calcular_tensor_projecao(probabilidades)
+
+def plotar_bandas_monte_carlo(resultados_mc, nivel_confianca):
+    """Plota a mediana e a banda de confiança de cada evento."""
+    import matplotlib.pyplot as plt
+    eventos_keys = list(resultados_mc.keys())
+    medianas = [resultados_mc[evento]["quantis"].get(0.5, resultados_mc[evento]["media"]) for evento in eventos_keys]
+    inferiores = [resultados_mc[evento]["banda"][0] for evento in eventos_keys]
+    superiores = [resultados_mc[evento]["banda"][1] for evento in eventos_keys]
+
+    fig, ax = plt.subplots()
+    ax.fill_between(eventos_keys, inferiores, superiores, color='purple', alpha=0.25, label=f"Banda de {nivel_confianca:.0%}")
+    ax.plot(eventos_keys, medianas, color='purple', marker="o", label="Mediana")
+    ax.set_xlabel("Evento Cósmico")
+    ax.set_ylabel("Valor de Aplicação")
+    ax.legend()
+    ax.grid()
+    plt.xticks(rotation=45)
+    st.pyplot(fig)
 
 def grafico_escala_sistema_solar(df_resultados):
     """Gráfico 3D para representar eventos em escala do sistema solar."""
+    import plotly.express as px
     fig = px.scatter_3d(
         df_resultados,
         x="Evento",
@@ -795,12 +867,15 @@ def grafico_escala_sistema_solar(df_resultados):
         title="Eventos Cósmicos em Escala do Sistema Solar",
         labels={"Valor de Aplicação": "Impacto", "Probabilidade Ajustada": "Probabilidade"}
     )
+    binarizar_figura(fig)
+    contar_bytes_figura(fig)
     st.plotly_chart(fig)
 
 def simular_distorcao_espaco_tempo(probabilidades_ajustadas):
     """Simula a distorção do tecido espaço-tempo."""
+    import matplotlib.pyplot as plt
     eventos = list(probabilidades_ajustadas.keys())
-    distorcao = [np.random.normal(0, 1) for _ in eventos]
+    distorcao = calcular_distorcao_eventos(probabilidades_ajustadas, semente=semente_fluxo("distorcao_eventos"))
     
     fig, ax = plt.subplots()
     ax.bar(eventos, distorcao, color='purple', label="Distorção do Espaço-Tempo")
@@ -811,6 +886,8 @@ def simular_distorcao_espaco_tempo(probabilidades_ajustadas):
     st.pyplot(fig)
 
 def modulo_aplicacoes_infinitas():
+    import pandas as pd
+    import matplotlib.pyplot as plt
     st.header("Aplicações e Cálculo Infinito")
     st.markdown("""
         Este módulo projeta dinamicamente as **ODDS (probabilidades)** de eventos cósmicos,
@@ -845,11 +922,22 @@ def modulo_aplicacoes_infinitas():
     tempo_decorrido = st.number_input("Tempo decorrido (minutos)", min_value=0, max_value=90, value=0, key="tempo_decorrido")
     eventos = st.number_input("Eventos significativos (colisões, explosões, etc.)", min_value=0, max_value=10, value=0, key="eventos_significativos")
     
+    modo_precalculado = st.checkbox(
+        "Modo pré-calculado (atualiza os gráficos a cada mudança de tempo ou eventos)",
+        value=False,
+        key="modo_precalculado"
+    )
+    
     # Aplicar distorção espaço-tempo às probabilidades
-    probabilidades_ajustadas = aplicar_distorcao_espaco_tempo(probabilidades, tempo_decorrido, eventos)
+    if modo_precalculado:
+        tensor = tensor_projecao_em_cache(probabilidades)
+        probabilidades_ajustadas = projecao_do_tensor(tensor, probabilidades, tempo_decorrido, eventos)
+    else:
+        probabilidades_ajustadas = aplicar_distorcao_espaco_tempo(probabilidades, tempo_decorrido, eventos)
     
     # Calcular aplicações iniciais
-    if st.button("Calcular Projeção de Probabilidades", key="calcular_projecao"):
+    calcular_projecao = st.button("Calcular Projeção de Probabilidades", key="calcular_projecao")
+    if calcular_projecao or modo_precalculado:
         aplicacoes = calcular_aplicacoes(probabilidades_ajustadas, valor_esperado)
         st.session_state["aplicacoes"] = aplicacoes
 
@@ -859,11 +947,13 @@ def modulo_aplicacoes_infinitas():
         st.dataframe(df_resultados)
 
         # Gráficos interativos
-        grafico_escala_galaxia(df_resultados)
-        grafico_escala_sistema_solar(df_resultados)
+        with etapa("graficos_escala", "render"):
+            grafico_escala_galaxia(df_resultados)
+            grafico_escala_sistema_solar(df_resultados)
 
         # Simulação da distorção do tecido espaço-tempo
-        simular_distorcao_espaco_tempo(probabilidades_ajustadas)
+        with etapa("simular_distorcao_espaco_tempo", "render"):
+            simular_distorcao_espaco_tempo(probabilidades_ajustadas)
 
         # Gráfico de comparação de probabilidades (antes e depois do ajuste)
         eventos_keys = list(probabilidades_ajustadas.keys())
@@ -883,6 +973,33 @@ def modulo_aplicacoes_infinitas():
         plt.xticks(rotation=45)
         st.pyplot(fig)
 
+    # Cenários Monte Carlo sobre as faixas de probabilidade, tempo e eventos
+    st.header("Cenários Monte Carlo")
+    num_cenarios = st.number_input("Número de Cenários", min_value=10_000, max_value=50_000_000, value=1_000_000, step=100_000, key="num_cenarios_mc")
+    faixa_tempo = st.slider("Faixa de Tempo decorrido (minutos)", min_value=0, max_value=90, value=(0, 90), key="faixa_tempo_mc")
+    faixa_eventos = st.slider("Faixa de Eventos significativos", min_value=0, max_value=10, value=(0, 10), key="faixa_eventos_mc")
+    nivel_confianca = st.slider("Nível de Confiança da Banda", min_value=0.5, max_value=0.99, value=0.9, step=0.01, key="nivel_confianca_mc")
+
+    if st.button("Simular Cenários Monte Carlo", key="simular_monte_carlo"):
+        with etapa("simular_monte_carlo_odds"):
+            resultados_mc = simular_monte_carlo_odds(probabilidades, faixa_tempo, faixa_eventos, valor_esperado,
+                                                     num_cenarios=int(num_cenarios), nivel_confianca=nivel_confianca,
+                                                     semente=semente_fluxo("monte_carlo_odds"))
+        df_mc = pd.DataFrame([
+            {
+                "Evento": evento,
+                "Média": r["media"],
+                "Desvio Padrão": r["desvio"],
+                **{f"Q{int(q * 100)}": v for q, v in r["quantis"].items()},
+                "Banda Inferior": r["banda"][0],
+                "Banda Superior": r["banda"][1],
+            }
+            for evento, r in resultados_mc.items()
+        ])
+        st.dataframe(df_mc)
+        with etapa("plotar_bandas_monte_carlo", "render"):
+            plotar_bandas_monte_carlo(resultados_mc, nivel_confianca)
+
 # ==================================================
 # Módulo 6: Ajuda e Orientação
 # ==================================================
@@ -947,7 +1064,7 @@ def modulo_ajuda_orientacao():
     
     # Dados de exemplo
     x = np.linspace(-10, 10, 100)
-    y = np.sin(x) + np.random.normal(0, 0.1, 100)
+    y = np.sin(x) + gerador(semente_fluxo("ajuda_orientacao")).normal(0, 0.1, 100)
     
     fig, ax = plt.subplots()
     ax.plot(x, y, label="Anomalia Gravitacional")
@@ -961,6 +1078,10 @@ def modulo_ajuda_orientacao():
 # Aplicativo Principal
 # ==================================================
 def main():
+    # Pré-aquecimento opcional: UNIVERSO_AUREO_PREAQUECER=1 streamlit run main.py
+    if os.environ.get("UNIVERSO_AUREO_PREAQUECER") == "1":
+        preaquecer_dependencias()
+
     st.sidebar.title("Universo Áureo")
     modulo = st.sidebar.radio(
         "Escolha o Módulo",
@@ -974,7 +1095,41 @@ def main():
         ],
         key="modulo_principal"  # Chave única para o menu principal
     )
+    # Painel de desempenho: também ativado por padrão com UNIVERSO_AUREO_PERFIL=1
+    painel_desempenho = st.sidebar.checkbox(
+        "📈 Painel de Desempenho",
+        value=os.environ.get("UNIVERSO_AUREO_PERFIL") == "1",
+        key="painel_desempenho"
+    )
+    st.sidebar.checkbox(
+        "Armazenamento Compacto (float32)",
+        value=False,
+        key="armazenamento_compacto",
+        help="Guarda trajetórias, séries, malhas e tabelas em float32 quando os valores cabem, usando metade da memória."
+    )
+    st.sidebar.number_input(
+        "Semente Aleatória",
+        min_value=0,
+        value=42,
+        step=1,
+        key="semente_aleatoria",
+        help="Mesma semente, mesmos resultados: órbitas, colisões, translação, pontos térmicos, distorções e cenários Monte Carlo são reproduzíveis."
+    )
+    if painel_desempenho or log_ativado():
+        iniciar_medicao(modulo)
+
+    try:
+        with etapa("carregar_dependencias"):
+            carregar_dependencias(DEPENDENCIAS_MODULOS[modulo])
+        executar_modulo(modulo)
+    finally:
+        medicao = finalizar_medicao()
+
+    exibir_tempos_importacao()
+    if painel_desempenho and medicao is not None:
+        exibir_painel_desempenho(medicao)
 
+def executar_modulo(modulo):
     if modulo == "Buracos Negros e Anomalias":
         modulo_buracos_negros()
     elif modulo == "Captação e Transformação de Energia":
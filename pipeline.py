@@ -0,0 +1,90 @@
+"""Grafo de etapas de cálculo com memoização por etapa.
+
+Cada etapa declara as suas entradas, que são parâmetros ou outras etapas, e guarda o último
+resultado junto com a impressão das entradas que o produziram. Ao pedir um cálculo, só são
+refeitas as etapas cujas entradas mudaram. Quando uma etapa refeita produz exatamente o mesmo
+resultado de antes, as etapas abaixo dela também são reaproveitadas.
+
+Exemplo::
+
+    pipeline = Pipeline()
+    pipeline.definir("sinal", "frequencia", "num_pontos")(gerar_sinal)
+    pipeline.definir("energia", "sinal", "alpha")(calcular_energia)
+    pipeline.calcular(["energia"], frequencia=432, num_pontos=100, alpha=0.5)
+    pipeline.calcular(["energia"], frequencia=432, num_pontos=100, alpha=0.7)  # só "energia" é refeita
+"""
+import hashlib
+
+import numpy as np
+
+from instrumentacao import contar, etapa
+
+def impressao(valor):
+    """Representação comparável de um valor de entrada ou resultado (arrays entram pelo hash do conteúdo)."""
+    if isinstance(valor, np.ndarray):
+        return ("ndarray", valor.dtype.str, valor.shape, hashlib.blake2b(np.ascontiguousarray(valor).data).hexdigest())
+    if isinstance(valor, np.random.SeedSequence):
+        return ("SeedSequence", valor.entropy, valor.spawn_key, valor.pool_size)
+    if isinstance(valor, dict):
+        return ("dict",) + tuple((chave, impressao(item)) for chave, item in valor.items())
+    if isinstance(valor, (list, tuple)):
+        return (type(valor).__name__,) + tuple(impressao(item) for item in valor)
+    return valor
+
+class Pipeline:
+    """Etapas de cálculo ligadas pelas suas entradas, cada uma com o último resultado memorizado."""
+
+    def __init__(self):
+        self._etapas = {}  # nome -> (função, nomes das entradas)
+        self._memoria = {}  # nome -> (impressão das entradas, versão, impressão do resultado, resultado)
+        self._versoes = 0
+
+    def definir(self, nome, *entradas):
+        """Decorador: registra `funcao(*entradas)` como a etapa `nome`."""
+        def registrar(funcao):
+            self._etapas[nome] = (funcao, entradas)
+            return funcao
+        return registrar
+
+    def calcular(self, alvos, **parametros):
+        """Resolve as etapas `alvos` para os parâmetros dados e retorna {etapa: resultado}."""
+        resolvidas = {}
+        return {alvo: self._resolver(alvo, parametros, resolvidas)[1] for alvo in alvos}
+
+    def _resolver(self, nome, parametros, resolvidas):
+        """Retorna (versão, resultado) da etapa, refazendo-a só se alguma entrada mudou."""
+        if nome in resolvidas:
+            return resolvidas[nome]
+        funcao, entradas = self._etapas[nome]
+        valores = []
+        chave = []
+        for entrada in entradas:
+            if entrada in self._etapas:
+                versao, valor = self._resolver(entrada, parametros, resolvidas)
+                chave.append(("etapa", versao))
+            elif entrada in parametros:
+                valor = parametros[entrada]
+                chave.append(impressao(valor))
+            else:
+                raise KeyError(f"Parâmetro ausente para a etapa {nome!r}: {entrada!r}")
+            valores.append(valor)
+        chave = tuple(chave)
+
+        memoria = self._memoria.get(nome)
+        if memoria is not None and memoria[0] == chave:
+            contar("etapas_reaproveitadas")
+            resolvidas[nome] = (memoria[1], memoria[3])
+            return resolvidas[nome]
+
+        with etapa(f"pipeline:{nome}"):
+            resultado = funcao(*valores)
+        contar("etapas_recalculadas")
+        impressao_resultado = impressao(resultado)
+        if memoria is not None and memoria[2] == impressao_resultado:
+            versao = memoria[1]  # Mesmo resultado: as etapas abaixo continuam válidas
+        else:
+            self._versoes += 1
+            versao = self._versoes
+        self._memoria[nome] = (chave, versao, impressao_resultado, resultado)
+        resolvidas[nome] = (versao, resultado)
+        return resolvidas[nome]
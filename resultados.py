@@ -0,0 +1,86 @@
+"""Representação compacta dos resultados e exportações sem cópias intermediárias.
+
+Cada módulo monta um único array estruturado (um registro por linha, um campo por coluna, com os
+mesmos nomes das colunas do CSV), opcionalmente em float32. Desse array saem direto o CSV (gerado
+em blocos), o `.npz` e o Parquet, sem passar por um DataFrame. O CSV só é transmitido em blocos quando
+o destino é um arquivo (`escrever_csv`); para o botão de download ele precisa estar inteiro em memória.
+"""
+import io
+
+import numpy as np
+
+def cabe_em_float32(valores):
+    """Indica se os valores finitos não estouram nem somem (underflow) em float32."""
+    finitos = np.abs(valores[np.isfinite(valores)])
+    nao_nulos = finitos[finitos > 0]
+    if nao_nulos.size == 0:
+        return True
+    limites = np.finfo(np.float32)
+    return nao_nulos.max() <= limites.max and nao_nulos.min() >= limites.tiny
+
+def compactar(valores, compacto=True):
+    """Converte arrays de ponto flutuante para float32 quando `compacto` e os valores cabem em float32.
+
+    Séries fora da faixa do float32 (ex.: energias orbitais da ordem de 1e44 J) continuam em float64.
+    """
+    valores = np.asarray(valores)
+    if compacto and valores.dtype.kind == "f" and valores.dtype.itemsize > 4 and cabe_em_float32(valores):
+        return valores.astype(np.float32)
+    return valores
+
+def criar_registros(colunas, compacto=False):
+    """Monta um array estruturado a partir de {nome da coluna: valores}, com float32 opcional."""
+    arrays = {nome: compactar(valores, compacto) for nome, valores in colunas.items()}
+    tamanho = len(next(iter(arrays.values())))
+    registros = np.empty(tamanho, dtype=[(nome, valores.dtype) for nome, valores in arrays.items()])
+    for nome, valores in arrays.items():
+        registros[nome] = valores
+    return registros
+
+def _campo_csv(texto):
+    """Aplica as aspas do CSV a um campo de texto quando necessário."""
+    if any(caractere in texto for caractere in ',"\n'):
+        return '"' + texto.replace('"', '""') + '"'
+    return texto
+
+def csv_em_blocos(registros, linhas_por_bloco=65536):
+    """Gera o CSV em blocos de bytes (cabeçalho primeiro), sem materializar o arquivo inteiro de uma vez."""
+    nomes = registros.dtype.names
+    yield (",".join(_campo_csv(nome) for nome in nomes) + "\n").encode("utf-8")
+    for inicio in range(0, len(registros), linhas_por_bloco):
+        bloco = registros[inicio:inicio + linhas_por_bloco]
+        colunas = []
+        for nome in nomes:
+            # astype(str) usa a representação mais curta que preserva o valor (float32 ou float64)
+            textos = bloco[nome].astype(str)
+            if registros.dtype[nome].kind == "U":
+                textos = [_campo_csv(texto) for texto in textos]
+            colunas.append(textos)
+        yield ("\n".join(",".join(linha) for linha in zip(*colunas)) + "\n").encode("utf-8")
+
+def escrever_csv(registros, destino):
+    """Escreve o CSV bloco a bloco em um arquivo binário aberto (só um bloco fica em memória por vez)."""
+    for bloco in csv_em_blocos(registros):
+        destino.write(bloco)
+
+def exportar_csv(registros):
+    """CSV inteiro em bytes, como o `st.download_button` exige; só a geração é feita em blocos."""
+    buffer = io.BytesIO()
+    escrever_csv(registros, buffer)
+    return buffer.getvalue()
+
+def exportar_npz(registros):
+    """`.npz` comprimido com o array estruturado em `registros` (np.load(...)["registros"])."""
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, registros=registros)
+    return buffer.getvalue()
+
+def exportar_parquet(registros):
+    """Parquet com uma coluna por campo, preservando float32 quando usado."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    tabela = pa.table({nome: np.ascontiguousarray(registros[nome]) for nome in registros.dtype.names})
+    buffer = io.BytesIO()
+    pq.write_table(tabela, buffer, compression="zstd")
+    return buffer.getvalue()
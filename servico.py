@@ -0,0 +1,352 @@
+"""Serviço HTTP local (asyncio) com endpoints em lote para as funções de cálculo.
+
+Cada requisição é um POST com um lote de conjuntos de parâmetros::
+
+    POST /distorcao   {"parametros": [{"massa": 1e30, "distancia": 9.461e15, "modelo": "Clássico"}, ...]}
+    POST /orbita      {"parametros": [{"massa_bn": 1e31, "massa_planeta": 1e24, "perturbacao": 0.02, "semente": 7}, ...]}
+    POST /frequencias {"parametros": [{"frequencia_alvo": 432, "harmonico_aureo": 3}, ...]}
+    POST /energia     {"parametros": [{"P": 200, "f_F": 50, "theta_F": 130, "R_l": 3, "alpha": -23.8}, ...]}
+
+O cálculo e a serialização rodam num `ProcessPoolExecutor`, então o loop de eventos nunca bloqueia.
+A resposta é um `.npz` comprimido (padrão, `?formato=npz`) ou JSON (`?formato=json`, com NaN como
+null), este com gzip quando o cliente envia `Accept-Encoding: gzip`. `GET /saude` responde sem passar pelo pool.
+
+Uso::
+
+    python servico.py servir --porta 8765 --processos 8
+    python servico.py carga http://127.0.0.1:8765/orbita --clientes 32 --requisicoes 2000 --lote 4
+"""
+import argparse
+import asyncio
+import gzip
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from calculos import (
+    bobina_aurea,
+    calcular_frequencias,
+    calcular_orbita,
+    corrente_fluxo,
+    distorcao_espaco_tempo,
+    energia_perdida,
+    energia_quantica_fluxo,
+    energia_singularidade,
+    tensao_fluxo,
+)
+
+TAMANHO_MAXIMO_CORPO = 64 * 1024 * 1024
+TAMANHO_MAXIMO_LOTE = 1024  # Conjuntos de parâmetros por requisição
+MAXIMO_PASSOS = 1_000_000  # num_passos de uma órbita (16 bytes de ruído por passo)
+MAXIMO_PASSOS_LOTE = 4_000_000  # num_passos somados das órbitas de um lote
+MAXIMO_HARMONICOS = 1000
+FORMATOS = ("npz", "json")
+MOTIVOS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+           500: "Internal Server Error", 503: "Service Unavailable"}
+
+# ==================================================
+# Endpoints (executados nos processos do pool)
+# ==================================================
+def lote_distorcao(parametros):
+    """Distorção do espaço-tempo vetorizada por modelo."""
+    massas = np.array([p["massa"] for p in parametros], dtype=float)
+    distancias = np.array([p["distancia"] for p in parametros], dtype=float)
+    modelos = np.array([p.get("modelo", "Clássico") for p in parametros])
+    distorcao = np.zeros(len(parametros))
+    for modelo in np.unique(modelos):
+        selecao = modelos == modelo
+        distorcao[selecao] = distorcao_espaco_tempo(massas[selecao], distancias[selecao], str(modelo))
+    return {"distorcao": distorcao}
+
+def lote_orbita(parametros):
+    """Uma órbita por conjunto de parâmetros; `trajetoria_i` e `energia_orbita_i` para o item i do lote."""
+    resultado = {}
+    for i, p in enumerate(parametros):
+        trajetoria, energia_orbita = calcular_orbita(
+            p["massa_bn"], p["massa_planeta"], p["perturbacao"],
+            num_passos=int(p.get("num_passos", 1000)), dt=p.get("dt", 0.05), semente=p.get("semente")
+        )
+        resultado[f"trajetoria_{i}"] = trajetoria
+        resultado[f"energia_orbita_{i}"] = energia_orbita
+    return resultado
+
+def lote_frequencias(parametros):
+    """Frequências harmônicas áureas; itens com menos harmônicos são completados com NaN."""
+    frequencias = [calcular_frequencias(p["frequencia_alvo"], int(p["harmonico_aureo"])) for p in parametros]
+    matriz = np.full((len(frequencias), max((len(f) for f in frequencias), default=0)), np.nan)
+    for i, f in enumerate(frequencias):
+        matriz[i, :len(f)] = f
+    return {"frequencias": matriz}
+
+def lote_energia(parametros):
+    """Grandezas de captação de energia vetorizadas sobre o lote."""
+    def coluna(nome, padrao):
+        return np.array([p.get(nome, padrao) for p in parametros], dtype=float)
+
+    P, f_F, theta_F = coluna("P", 200.0), coluna("f_F", 50.0), coluna("theta_F", 130.0)
+    R_l, alpha = coluna("R_l", 3.0), coluna("alpha", -23.8)
+    E_F = energia_quantica_fluxo(f_F)
+    V_F = tensao_fluxo(E_F)
+    return {
+        "E_F": E_F,
+        "V_F": V_F,
+        "I_F": corrente_fluxo(P, V_F, theta_F),
+        "E_p": energia_perdida(E_F, alpha, R_l),
+        "E_singularidade": energia_singularidade(E_F, alpha, R_l),
+        "energia_bobina": bobina_aurea(f_F, R_l),
+    }
+
+ENDPOINTS = {
+    "/distorcao": lote_distorcao,
+    "/orbita": lote_orbita,
+    "/frequencias": lote_frequencias,
+    "/energia": lote_energia,
+}
+
+def lista_json(valor):
+    """Array como lista para JSON, com NaN e infinitos trocados por None (null), que o JSON não representa."""
+    array = np.asarray(valor)
+    if array.dtype.kind in "fc":
+        return np.where(np.isfinite(array), array, None).tolist()
+    return array.tolist()
+
+def validar_lote(rota, parametros):
+    """Recusa (ValueError) lotes grandes demais antes de alocar qualquer coisa: um pedido só não pode derrubar o processo."""
+    if not isinstance(parametros, list):
+        raise ValueError("'parametros' deve ser uma lista")
+    if len(parametros) > TAMANHO_MAXIMO_LOTE:
+        raise ValueError(f"Lote com {len(parametros)} itens; o máximo é {TAMANHO_MAXIMO_LOTE}")
+    if rota == "/orbita":
+        passos = [int(p.get("num_passos", 1000)) for p in parametros]
+        if any(n < 1 or n > MAXIMO_PASSOS for n in passos):
+            raise ValueError(f"num_passos deve estar entre 1 e {MAXIMO_PASSOS}")
+        if sum(passos) > MAXIMO_PASSOS_LOTE:
+            raise ValueError(f"Soma de num_passos do lote acima de {MAXIMO_PASSOS_LOTE}")
+    elif rota == "/frequencias":
+        if any(not 0 <= int(p["harmonico_aureo"]) <= MAXIMO_HARMONICOS for p in parametros):
+            raise ValueError(f"harmonico_aureo deve estar entre 0 e {MAXIMO_HARMONICOS}")
+
+def processar_lote(rota, corpo, formato, gzip_aceito):
+    """Decodifica o lote, calcula e serializa a resposta; retorna (tipo de conteúdo, codificação, bytes)."""
+    parametros = json.loads(corpo)["parametros"]
+    validar_lote(rota, parametros)
+    resultado = ENDPOINTS[rota](parametros)
+    if formato == "json":
+        dados = json.dumps({nome: lista_json(valor) for nome, valor in resultado.items()}, allow_nan=False).encode("utf-8")
+        if gzip_aceito:
+            return "application/json", "gzip", gzip.compress(dados, compresslevel=5)
+        return "application/json", None, dados
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **resultado)
+    return "application/octet-stream", None, buffer.getvalue()
+
+# ==================================================
+# Servidor HTTP
+# ==================================================
+class PoolCalculo:
+    """`ProcessPoolExecutor` do serviço, trocado por um novo quando um processo filho morre."""
+
+    def __init__(self, num_processos):
+        self.num_processos = num_processos
+        self.executor = ProcessPoolExecutor(max_workers=num_processos)
+
+    def substituir(self, quebrado):
+        """Troca o pool `quebrado` por um novo (uma vez só, mesmo com várias requisições falhando juntas)."""
+        if self.executor is quebrado:
+            self.executor = ProcessPoolExecutor(max_workers=self.num_processos)
+            quebrado.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        self.executor.shutdown(cancel_futures=True)
+
+async def _ler_requisicao(reader):
+    """Lê uma requisição HTTP/1.1; retorna None quando o cliente fecha a conexão."""
+    linha = await reader.readline()
+    if not linha:
+        return None
+    metodo, alvo, versao = linha.decode("latin-1").split()
+    cabecalhos = {}
+    while True:
+        linha = await reader.readline()
+        if linha in (b"\r\n", b"\n", b""):
+            break
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        cabecalhos[nome.strip().lower()] = valor.strip()
+    tamanho = int(cabecalhos.get("content-length", 0))
+    if tamanho > TAMANHO_MAXIMO_CORPO:
+        return metodo, alvo, versao, cabecalhos, None
+    corpo = await reader.readexactly(tamanho) if tamanho else b""
+    return metodo, alvo, versao, cabecalhos, corpo
+
+def _resposta(status, tipo, dados, codificacao=None, manter_conexao=True):
+    cabecalhos = [
+        f"HTTP/1.1 {status} {MOTIVOS[status]}",
+        f"Content-Type: {tipo}",
+        f"Content-Length: {len(dados)}",
+        f"Connection: {'keep-alive' if manter_conexao else 'close'}",
+    ]
+    if codificacao:
+        cabecalhos.append(f"Content-Encoding: {codificacao}")
+    return ("\r\n".join(cabecalhos) + "\r\n\r\n").encode("latin-1") + dados
+
+def _erro(status, mensagem):
+    return status, "application/json", json.dumps({"erro": mensagem}, ensure_ascii=False).encode("utf-8"), None
+
+async def _atender(metodo, alvo, cabecalhos, corpo, pool):
+    url = urlsplit(alvo)
+    if url.path == "/saude":
+        return 200, "application/json", b'{"status": "ok"}', None
+    if url.path not in ENDPOINTS:
+        return _erro(404, f"Endpoint desconhecido: {url.path}. Opções: {', '.join(ENDPOINTS)}")
+    if metodo != "POST":
+        return _erro(405, "Use POST com {\"parametros\": [...]}")
+    if corpo is None:
+        return _erro(413, f"Corpo maior que {TAMANHO_MAXIMO_CORPO} bytes")
+
+    formato = parse_qs(url.query).get("formato", ["npz"])[0]
+    if formato not in FORMATOS:
+        return _erro(400, f"Formato desconhecido: {formato!r}. Opções: {', '.join(FORMATOS)}")
+    gzip_aceito = "gzip" in cabecalhos.get("accept-encoding", "")
+    loop = asyncio.get_running_loop()
+    executor = pool.executor
+    try:
+        tipo, codificacao, dados = await loop.run_in_executor(
+            executor, processar_lote, url.path, corpo, formato, gzip_aceito
+        )
+    except BrokenProcessPool:
+        # Um processo do pool morreu (ex.: falta de memória): as próximas requisições vão para um pool novo
+        pool.substituir(executor)
+        return _erro(503, "Processo de cálculo encerrado durante a requisição; tente de novo")
+    except (ValueError, KeyError, TypeError) as erro:
+        return _erro(400, f"Parâmetros inválidos: {erro!r}")
+    return 200, tipo, dados, codificacao
+
+async def servir(host="127.0.0.1", porta=8765, num_processos=None):
+    """Inicia o serviço e atende até ser interrompido."""
+    num_processos = num_processos or os.cpu_count()
+    pool = PoolCalculo(num_processos)
+
+    async def conexao(reader, writer):
+        try:
+            while True:
+                requisicao = await _ler_requisicao(reader)
+                if requisicao is None:
+                    break
+                metodo, alvo, versao, cabecalhos, corpo = requisicao
+                manter_conexao = versao == "HTTP/1.1" and cabecalhos.get("connection", "").lower() != "close"
+                try:
+                    status, tipo, dados, codificacao = await _atender(metodo, alvo, cabecalhos, corpo, pool)
+                except Exception as erro:
+                    status, tipo, dados, codificacao = _erro(500, repr(erro))
+                writer.write(_resposta(status, tipo, dados, codificacao, manter_conexao))
+                await writer.drain()
+                if not manter_conexao or corpo is None:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    servidor = await asyncio.start_server(conexao, host, porta)
+    print(f"Servindo em http://{host}:{porta} ({num_processos} processos)")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        pool.shutdown()
+
+# ==================================================
+# Gerador de carga
+# ==================================================
+CORPOS_EXEMPLO = {
+    "/distorcao": {"massa": 1e30, "distancia": 9.461e15, "modelo": "Fluxo Matemático"},
+    "/orbita": {"massa_bn": 1e31, "massa_planeta": 1e24, "perturbacao": 0.02, "num_passos": 1000},
+    "/frequencias": {"frequencia_alvo": 432, "harmonico_aureo": 5},
+    "/energia": {"P": 200.0, "f_F": 50.0, "theta_F": 130.0, "R_l": 3.0, "alpha": -23.8},
+}
+
+async def gerar_carga(url, num_clientes=16, num_requisicoes=1000, tamanho_lote=1, formato="npz"):
+    """Dispara requisições concorrentes com conexões keep-alive e mede vazão e latências (p50/p95/p99)."""
+    partes = urlsplit(url)
+    corpo = json.dumps({"parametros": [CORPOS_EXEMPLO[partes.path]] * tamanho_lote}).encode("utf-8")
+    requisicao = (
+        f"POST {partes.path}?formato={formato} HTTP/1.1\r\nHost: {partes.netloc}\r\n"
+        f"Content-Type: application/json\r\nAccept-Encoding: gzip\r\nContent-Length: {len(corpo)}\r\n\r\n"
+    ).encode("latin-1") + corpo
+    restantes = [num_requisicoes]
+    latencias = []
+    bytes_recebidos = [0]
+
+    async def cliente():
+        reader, writer = await asyncio.open_connection(partes.hostname, partes.port)
+        try:
+            while restantes[0] > 0:
+                restantes[0] -= 1
+                inicio = time.perf_counter()
+                writer.write(requisicao)
+                await writer.drain()
+                status = (await reader.readline()).split()[1]
+                tamanho = 0
+                while (linha := await reader.readline()) not in (b"\r\n", b""):
+                    if linha.lower().startswith(b"content-length:"):
+                        tamanho = int(linha.split(b":")[1])
+                await reader.readexactly(tamanho)
+                latencias.append(time.perf_counter() - inicio)
+                bytes_recebidos[0] += tamanho
+                if status != b"200":
+                    raise RuntimeError(f"Resposta HTTP {status.decode()}")
+        finally:
+            writer.close()
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente() for _ in range(num_clientes)))
+    duracao = time.perf_counter() - inicio
+    latencias_ms = np.array(latencias) * 1e3
+    return {
+        "requisicoes": len(latencias),
+        "itens_por_requisicao": tamanho_lote,
+        "duracao_s": duracao,
+        "requisicoes_por_s": len(latencias) / duracao,
+        "itens_por_s": len(latencias) * tamanho_lote / duracao,
+        "bytes_por_resposta": bytes_recebidos[0] / max(len(latencias), 1),
+        "latencia_p50_ms": float(np.percentile(latencias_ms, 50)),
+        "latencia_p95_ms": float(np.percentile(latencias_ms, 95)),
+        "latencia_p99_ms": float(np.percentile(latencias_ms, 99)),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serviço local de cálculo do Universo Áureo.")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    servir_parser = subparsers.add_parser("servir", help="Inicia o serviço HTTP")
+    servir_parser.add_argument("--host", default="127.0.0.1")
+    servir_parser.add_argument("--porta", type=int, default=8765)
+    servir_parser.add_argument("--processos", type=int, default=None)
+
+    carga = subparsers.add_parser("carga", help="Mede vazão e latência de um endpoint com clientes concorrentes")
+    carga.add_argument("url", help="Ex.: http://127.0.0.1:8765/orbita")
+    carga.add_argument("--clientes", type=int, default=16)
+    carga.add_argument("--requisicoes", type=int, default=1000)
+    carga.add_argument("--lote", type=int, default=1, help="Conjuntos de parâmetros por requisição")
+    carga.add_argument("--formato", choices=["npz", "json"], default="npz")
+
+    args = parser.parse_args(argv)
+    if args.comando == "servir":
+        try:
+            asyncio.run(servir(args.host, args.porta, args.processos))
+        except KeyboardInterrupt:
+            pass
+    else:
+        metricas = asyncio.run(gerar_carga(args.url, args.clientes, args.requisicoes, args.lote, args.formato))
+        print(json.dumps(metricas, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
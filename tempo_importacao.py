@@ -0,0 +1,91 @@
+"""Relatório de tempo de importação do aplicativo e das dependências de cada módulo.
+
+Executa `python -X importtime` em processos novos (importação a frio), mede `import main` e o
+conjunto de dependências de cada módulo de `DEPENDENCIAS_MODULOS` e lista os pacotes mais pesados.
+Com `--limite-ms`, termina com código 1 se a partida a frio do aplicativo passar do limite.
+
+Uso::
+
+    python tempo_importacao.py
+    python tempo_importacao.py --json --limite-ms 1500
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+
+def medir_importacao(codigo):
+    """Executa `codigo` com `-X importtime` e retorna [(pacote, próprio_us, acumulado_us, nível)]."""
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        cwd=DIRETORIO, capture_output=True, text=True, check=True
+    )
+    medidas = []
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith("import time:") or "[us]" in linha:
+            continue
+        proprio, acumulado, pacote = linha[len("import time:"):].split("|")
+        nivel = (len(pacote) - len(pacote.lstrip())) // 2
+        medidas.append((pacote.strip(), int(proprio), int(acumulado), nivel))
+    return medidas
+
+def total_ms(medidas):
+    """Soma dos tempos acumulados das importações de primeiro nível, em milissegundos."""
+    return sum(acumulado for _, _, acumulado, nivel in medidas if nivel == 0) / 1e3
+
+def dependencias_modulos():
+    """Lê `DEPENDENCIAS_MODULOS` de main.py sem importá-lo (o que carregaria o Streamlit)."""
+    with open(os.path.join(DIRETORIO, "main.py"), encoding="utf-8") as arquivo:
+        arvore = ast.parse(arquivo.read())
+    for no in arvore.body:
+        if isinstance(no, ast.Assign) and any(getattr(alvo, "id", None) == "DEPENDENCIAS_MODULOS" for alvo in no.targets):
+            return ast.literal_eval(no.value)
+    return {}
+
+def gerar_relatorio(num_pacotes=15):
+    medidas_main = medir_importacao("import main")
+    # Nível 1: importações diretas de main.py (e de `site`, na inicialização do interpretador)
+    pacotes = sorted(
+        ((pacote, acumulado) for pacote, _, acumulado, nivel in medidas_main if nivel == 1),
+        key=lambda item: item[1], reverse=True
+    )
+    return {
+        "partida_a_frio_ms": total_ms(medidas_main),
+        "pacotes_mais_pesados_ms": {pacote: acumulado / 1e3 for pacote, acumulado in pacotes[:num_pacotes]},
+        # Custo adicional, sobre a partida a frio, de abrir cada módulo pela primeira vez
+        "modulos_ms": {
+            modulo: total_ms(medir_importacao("import main; import " + ", ".join(nomes))) - total_ms(medidas_main)
+            for modulo, nomes in dependencias_modulos().items()
+        },
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tempo de importação a frio do Universo Áureo.")
+    parser.add_argument("--json", action="store_true", help="Saída em JSON")
+    parser.add_argument("--pacotes", type=int, default=15, help="Quantos pacotes mais pesados listar")
+    parser.add_argument("--limite-ms", type=float, default=None, help="Falha se a partida a frio passar deste valor")
+    args = parser.parse_args(argv)
+
+    relatorio = gerar_relatorio(args.pacotes)
+    if args.json:
+        print(json.dumps(relatorio, ensure_ascii=False, indent=2))
+    else:
+        print(f"Partida a frio (import main): {relatorio['partida_a_frio_ms']:.0f} ms")
+        print("\nPacotes mais pesados:")
+        for pacote, ms in relatorio["pacotes_mais_pesados_ms"].items():
+            print(f"  {ms:8.0f} ms  {pacote}")
+        print("\nCusto adicional ao abrir cada módulo:")
+        for modulo, ms in relatorio["modulos_ms"].items():
+            print(f"  {ms:8.0f} ms  {modulo}")
+
+    if args.limite_ms is not None and relatorio["partida_a_frio_ms"] > args.limite_ms:
+        print(f"\nPartida a frio acima do limite de {args.limite_ms:.0f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
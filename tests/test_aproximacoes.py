@@ -0,0 +1,68 @@
+"""Encontros do índice comparados com uma referência por amostragem densa dos segmentos."""
+import numpy as np
+import pytest
+
+from aproximacoes import aproximacao_minima, indexar_encontros
+
+NUM_CORPOS = 6
+NUM_PASSOS = 400
+AMOSTRAS_POR_SEGMENTO = 64
+
+@pytest.fixture(scope="module")
+def trajetorias():
+    rng = np.random.default_rng(0)
+    return [np.cumsum(rng.normal(0, 0.05, (NUM_PASSOS, 2)), axis=0) + rng.normal(0, 0.5, 2) for _ in range(NUM_CORPOS)]
+
+def amostrar_separacao(trajetorias, i, j):
+    """Instantes e distâncias do par (i, j) amostrados densamente, com interpolação linear entre os passos."""
+    separacao = trajetorias[i] - trajetorias[j]
+    s = np.linspace(0, 1, AMOSTRAS_POR_SEGMENTO, endpoint=False)
+    instantes = (np.arange(NUM_PASSOS - 1)[:, None] + s).ravel()
+    pontos = separacao[:-1, None] + s[:, None] * np.diff(separacao, axis=0)[:, None]
+    instantes = np.append(instantes, NUM_PASSOS - 1)
+    distancias = np.append(np.linalg.norm(pontos, axis=2).ravel(), np.linalg.norm(separacao[-1]))
+    return instantes, distancias
+
+def distancia_em(trajetorias, i, j, instante):
+    separacao = trajetorias[i] - trajetorias[j]
+    k = min(int(np.floor(instante)), NUM_PASSOS - 2)
+    return np.linalg.norm(separacao[k] + (instante - k) * (separacao[k + 1] - separacao[k]))
+
+@pytest.mark.parametrize("distancia, passo_inicial, passo_final", [
+    (0.3, 0, NUM_PASSOS - 1),
+    (0.15, 40.5, 310.25),
+    (0.08, 100, 250.75),
+])
+def test_encontros_conferem_com_amostragem_densa(trajetorias, distancia, passo_inicial, passo_final):
+    indice = indexar_encontros(trajetorias, 0.3, tamanho_bloco=32)
+    encontros = indice.consultar(distancia, passo_inicial, passo_final)
+    for i in range(NUM_CORPOS):
+        for j in range(i + 1, NUM_CORPOS):
+            instantes, distancias = amostrar_separacao(trajetorias, i, j)
+            janela = (instantes >= passo_inicial) & (instantes <= passo_final)
+            referencia = distancias[janela].min()
+            do_par = encontros[(encontros["i"] == i) & (encontros["j"] == j)]
+            # A amostragem só pode perder encontros muito rasos; o cálculo contínuo nunca fica acima dela
+            if referencia < distancia:
+                assert len(do_par) > 0
+                assert do_par["distancia_minima"].min() <= referencia + 1e-12
+            elif len(do_par) == 0:
+                continue
+            for encontro in do_par:
+                assert passo_inicial - 1e-9 <= encontro["inicio"] < encontro["fim"] <= passo_final + 1e-9
+                assert encontro["distancia_minima"] < distancia
+                assert distancia_em(trajetorias, i, j, encontro["instante_minimo"]) == pytest.approx(encontro["distancia_minima"], abs=1e-12)
+                meio = (encontro["inicio"] + encontro["fim"]) / 2
+                assert distancia_em(trajetorias, i, j, meio) < distancia + 1e-12
+                # Bordas internas à janela ficam exatamente no limiar
+                if encontro["inicio"] > passo_inicial + 1e-9:
+                    assert distancia_em(trajetorias, i, j, encontro["inicio"]) == pytest.approx(distancia, abs=1e-9)
+                if encontro["fim"] < passo_final - 1e-9:
+                    assert distancia_em(trajetorias, i, j, encontro["fim"]) == pytest.approx(distancia, abs=1e-9)
+
+def test_aproximacao_minima_confere_com_amostragem_densa(trajetorias):
+    instante, distancia = aproximacao_minima(trajetorias[0], trajetorias[1])
+    _, distancias = amostrar_separacao(trajetorias, 0, 1)
+    assert distancia <= distancias.min() + 1e-12
+    assert distancia == pytest.approx(distancias.min(), abs=1e-3)
+    assert distancia_em(trajetorias, 0, 1, instante) == pytest.approx(distancia, abs=1e-12)
@@ -0,0 +1,51 @@
+"""Validação dos lotes e recuperação do pool do serviço HTTP."""
+import asyncio
+import json
+import os
+
+import pytest
+
+import servico
+from servico import MAXIMO_PASSOS, PoolCalculo, _atender, processar_lote
+
+ORBITA = {"massa_bn": 1e31, "massa_planeta": 1e24, "perturbacao": 0.02, "semente": 7, "num_passos": 10}
+
+def corpo(*parametros):
+    return json.dumps({"parametros": list(parametros)}).encode("utf-8")
+
+def atender(alvo, dados, pool):
+    status, _, resposta, _ = asyncio.run(_atender("POST", alvo, {}, dados, pool))
+    return status, resposta
+
+def processar_e_cair(*args):
+    os._exit(1)
+
+@pytest.fixture
+def pool():
+    pool = PoolCalculo(1)
+    yield pool
+    pool.shutdown()
+
+def test_formato_desconhecido_e_recusado(pool):
+    status, resposta = atender("/orbita?formato=xml", corpo(ORBITA), pool)
+    assert status == 400
+    assert "formato" in json.loads(resposta)["erro"].lower()
+
+@pytest.mark.parametrize("parametros", [
+    [{**ORBITA, "num_passos": MAXIMO_PASSOS + 1}],
+    [{**ORBITA, "num_passos": 0}],
+    [ORBITA] * (servico.TAMANHO_MAXIMO_LOTE + 1),
+    [{**ORBITA, "num_passos": MAXIMO_PASSOS}] * (servico.MAXIMO_PASSOS_LOTE // MAXIMO_PASSOS + 1),
+])
+def test_lote_grande_demais_e_recusado_antes_do_calculo(parametros, pool):
+    with pytest.raises(ValueError):
+        processar_lote("/orbita", corpo(*parametros), "npz", False)
+    assert atender("/orbita", corpo(*parametros), pool)[0] == 400
+
+def test_pool_quebrado_e_substituido(pool, monkeypatch):
+    monkeypatch.setattr(servico, "processar_lote", processar_e_cair)
+    quebrado = pool.executor
+    assert atender("/orbita", corpo(ORBITA), pool)[0] == 503
+    assert pool.executor is not quebrado
+    monkeypatch.undo()
+    assert atender("/orbita?formato=json", corpo(ORBITA), pool)[0] == 200
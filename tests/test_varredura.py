@@ -0,0 +1,109 @@
+"""Travas, falhas e quedas de processo na execução de varreduras."""
+import os
+import time
+
+import pytest
+
+import varredura
+from varredura import (
+    _caminho_shard, criar_manifesto, executar_shard, executar_varredura, reivindicar_shard, status_varredura,
+)
+
+EXPIRACAO = 60.0
+
+@pytest.fixture
+def diretorio(tmp_path):
+    criar_manifesto(str(tmp_path), "energia", {"P": [1.0, 2.0, 3.0, 4.0]}, tamanho_shard=1, semente=7)
+    return str(tmp_path)
+
+def arquivos(diretorio, extensao):
+    return sorted(nome for nome in os.listdir(os.path.join(diretorio, "shards")) if nome.endswith(extensao))
+
+def executar_shard_que_cai(diretorio, modulo, semente, shard):
+    """Derruba o processo filho no ponto P == 2; com o marcador `cai_uma_vez`, só na primeira tentativa."""
+    if shard["pontos"][0]["P"] == 2.0:
+        marcador = os.path.join(diretorio, "ja_caiu")
+        if not os.path.exists(os.path.join(diretorio, "cai_uma_vez")) or not os.path.exists(marcador):
+            open(marcador, "w").close()
+            os._exit(1)
+    return executar_shard(diretorio, modulo, semente, shard)
+
+def test_queda_passageira_repete_os_shards_sem_erro(diretorio, monkeypatch):
+    monkeypatch.setattr(varredura, "executar_shard", executar_shard_que_cai)
+    open(os.path.join(diretorio, "cai_uma_vez"), "w").close()
+    concluidos = executar_varredura(diretorio, num_processos=2, expiracao=EXPIRACAO)
+    assert sorted(concluidos) == [0, 1, 2, 3]
+    assert len(arquivos(diretorio, ".npz")) == 4
+    assert arquivos(diretorio, ".erro") == []
+    assert arquivos(diretorio, ".trava") == []
+
+def test_queda_persistente_deixa_o_shard_pendente(diretorio, monkeypatch):
+    monkeypatch.setattr(varredura, "executar_shard", executar_shard_que_cai)
+    concluidos = executar_varredura(diretorio, num_processos=2, expiracao=EXPIRACAO)
+    assert sorted(concluidos) == [0, 2, 3]
+    assert arquivos(diretorio, ".erro") == []
+    assert arquivos(diretorio, ".trava") == []
+    status = status_varredura(diretorio)
+    assert (status["concluidos"], status["com_erro"], status["pendentes"]) == (3, 0, 1)
+
+def test_falha_no_submit_libera_a_trava(diretorio, monkeypatch):
+    class PoolQuebrado:
+        def __init__(self, max_workers=None):
+            pass
+
+        def submit(self, *args):
+            raise RuntimeError("submit falhou")
+
+        def shutdown(self, **kwargs):
+            pass
+
+    monkeypatch.setattr(varredura, "ProcessPoolExecutor", PoolQuebrado)
+    with pytest.raises(RuntimeError):
+        executar_varredura(diretorio, num_processos=2, expiracao=EXPIRACAO)
+    assert arquivos(diretorio, ".trava") == []
+
+def test_trava_recente_nao_e_assumida(diretorio):
+    trava = _caminho_shard(diretorio, 0, "trava")
+    with open(trava, "w") as arquivo:
+        arquivo.write("outro:1")
+    assert not reivindicar_shard(diretorio, 0, EXPIRACAO)
+    with open(trava) as arquivo:
+        assert arquivo.read() == "outro:1"
+
+def test_trava_expirada_e_assumida_e_o_shard_executado(diretorio):
+    trava = _caminho_shard(diretorio, 0, "trava")
+    with open(trava, "w") as arquivo:
+        arquivo.write("outro:1")
+    antigo = time.time() - 2 * EXPIRACAO
+    os.utime(trava, (antigo, antigo))
+    assert reivindicar_shard(diretorio, 0, EXPIRACAO)
+    with open(trava) as arquivo:
+        assert arquivo.read() != "outro:1"
+    varredura.liberar_shard(diretorio, 0)
+
+    # A varredura também assume a trava abandonada e executa o shard
+    with open(trava, "w") as arquivo:
+        arquivo.write("outro:1")
+    os.utime(trava, (antigo, antigo))
+    assert sorted(executar_varredura(diretorio, num_processos=1, expiracao=EXPIRACAO)) == [0, 1, 2, 3]
+    assert arquivos(diretorio, ".trava") == []
+
+def test_trava_renovada_durante_a_tomada_e_devolvida(diretorio, monkeypatch):
+    # Outro worker recria a trava entre a leitura do mtime (que ainda vê a antiga) e o rename
+    trava = _caminho_shard(diretorio, 0, "trava")
+    with open(trava, "w") as arquivo:
+        arquivo.write("outro:1")
+    getmtime = os.path.getmtime
+    chamadas = []
+
+    def getmtime_atrasado(caminho):
+        chamadas.append(caminho)
+        return 0.0 if len(chamadas) == 1 else getmtime(caminho)
+
+    monkeypatch.setattr(os.path, "getmtime", getmtime_atrasado)
+    assert not reivindicar_shard(diretorio, 0, EXPIRACAO)
+    monkeypatch.undo()
+    with open(trava) as arquivo:
+        assert arquivo.read() == "outro:1"
+    assert arquivos(diretorio, ".trava") == ["shard_00000.trava"]
+    assert [nome for nome in os.listdir(os.path.join(diretorio, "shards")) if "expirada" in nome] == []
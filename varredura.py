@@ -0,0 +1,325 @@
+"""Varreduras de parâmetros em paralelo, divididas em shards retomáveis.
+
+A grade de parâmetros (produto cartesiano das listas informadas) é dividida em shards descritos
+em `manifesto.json`, dentro de um diretório que pode ser compartilhado entre várias máquinas.
+Cada worker reivindica um shard criando `shards/shard_NNNNN.trava` de forma exclusiva, executa o shard
+num `ProcessPoolExecutor` com semente própria e grava `shards/shard_NNNNN.npz` por troca atômica.
+Shards já gravados são pulados, então um worker reiniciado continua de onde parou, e travas mais
+antigas que `--expiracao` segundos (worker que caiu) voltam a ficar disponíveis.
+Um shard que falha tem o traceback gravado em `shards/shard_NNNNN.erro`, reportado por `status`, e
+a varredura segue com os demais; apague o `.erro` para tentar o shard de novo. Um processo filho que
+morre (falta de memória, segfault) não grava `.erro`: o pool é refeito e os shards afetados são repetidos.
+
+Uso::
+
+    python varredura.py criar estudo/ --modulo orbita --grade grade.json --tamanho-shard 4 --semente 7
+    python varredura.py executar estudo/ --processos 8
+    python varredura.py status estudo/
+
+Exemplo de `grade.json` para o módulo `orbita`::
+
+    {"massa_bn": [1e30, 1e31], "perturbacao": [0.0, 0.02, 0.05], "num_passos": [1000, 5000], "massa_planeta": [1e24]}
+"""
+import argparse
+import itertools
+import json
+import os
+import socket
+import sys
+import time
+import traceback
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from lote import MODULOS, executar_cenario
+
+MANIFESTO = "manifesto.json"
+QUEDAS_POR_SHARD = 2  # Quedas do processo filho, com o shard rodando sozinho, antes de desistir dele nesta execução
+
+# ==================================================
+# Manifesto
+# ==================================================
+def expandir_grade(grade):
+    """Produto cartesiano da grade {parâmetro: [valores]} como lista de dicionários de parâmetros."""
+    nomes = list(grade)
+    return [dict(zip(nomes, valores)) for valores in itertools.product(*(grade[nome] for nome in nomes))]
+
+def criar_manifesto(diretorio, modulo, grade, tamanho_shard=1, semente=0):
+    """Divide a grade em shards e grava o manifesto; recusa sobrescrever um manifesto existente."""
+    if modulo not in MODULOS:
+        raise ValueError(f"Módulo desconhecido: {modulo!r}. Opções: {', '.join(MODULOS)}")
+    pontos = expandir_grade(grade)
+    manifesto = {
+        "modulo": modulo,
+        "semente": semente,
+        "shards": [
+            {"indice": indice, "pontos": pontos[inicio:inicio + tamanho_shard]}
+            for indice, inicio in enumerate(range(0, len(pontos), tamanho_shard))
+        ],
+    }
+    os.makedirs(os.path.join(diretorio, "shards"), exist_ok=True)
+    # Criação exclusiva: dois hosts iniciando a mesma varredura não sobrescrevem o manifesto um do outro
+    with open(os.path.join(diretorio, MANIFESTO), "x", encoding="utf-8") as arquivo:
+        json.dump(manifesto, arquivo, ensure_ascii=False, indent=2)
+    return manifesto
+
+def carregar_manifesto(diretorio):
+    with open(os.path.join(diretorio, MANIFESTO), encoding="utf-8") as arquivo:
+        return json.load(arquivo)
+
+def _caminho_shard(diretorio, indice, extensao):
+    return os.path.join(diretorio, "shards", f"shard_{indice:05d}.{extensao}")
+
+def shard_concluido(diretorio, indice):
+    return os.path.exists(_caminho_shard(diretorio, indice, "npz"))
+
+def shard_com_erro(diretorio, indice):
+    return os.path.exists(_caminho_shard(diretorio, indice, "erro"))
+
+def registrar_erro(diretorio, indice, erro):
+    """Grava o traceback da falha em `shard_NNNNN.erro` (apague o arquivo para tentar o shard de novo)."""
+    destino = _caminho_shard(diretorio, indice, "erro")
+    temporario = f"{destino}.{socket.gethostname()}-{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        arquivo.write("".join(traceback.format_exception(erro)))
+    os.replace(temporario, destino)
+
+# ==================================================
+# Reivindicação de shards
+# ==================================================
+def reivindicar_shard(diretorio, indice, expiracao=3600.0):
+    """Tenta reivindicar o shard; retorna False se já estiver concluído, com erro ou em execução em outro worker."""
+    if shard_concluido(diretorio, indice) or shard_com_erro(diretorio, indice):
+        return False
+    trava = _caminho_shard(diretorio, indice, "trava")
+    dono = f"{socket.gethostname()}:{os.getpid()}"
+    try:
+        descritor = os.open(trava, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            if time.time() - os.path.getmtime(trava) < expiracao:
+                return False
+            # Trava expirada: só o worker que conseguir renomeá-la assume o shard
+            expirada = f"{trava}.expirada-{dono.replace(':', '-')}"
+            os.rename(trava, expirada)
+        except FileNotFoundError:
+            return False
+        # Entre o getmtime e o rename, outro worker pode ter assumido o shard e criado uma trava nova; o
+        # rename preserva o mtime, então uma trava recente é devolvida ao seu dono em vez de apagada
+        if time.time() - os.path.getmtime(expirada) < expiracao:
+            try:
+                os.link(expirada, trava)
+                os.remove(expirada)
+            except FileExistsError:
+                os.remove(expirada)
+            except OSError:
+                os.rename(expirada, trava)  # Sistema de arquivos sem links físicos
+            return False
+        os.remove(expirada)
+        try:
+            descritor = os.open(trava, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+    with os.fdopen(descritor, "w") as arquivo:
+        arquivo.write(dono)
+    # O shard pode ter sido concluído entre a verificação e a criação da trava
+    if shard_concluido(diretorio, indice):
+        liberar_shard(diretorio, indice)
+        return False
+    return True
+
+def renovar_trava(diretorio, indice):
+    """Atualiza o mtime da trava de um shard em execução, para que ela não seja tomada como expirada."""
+    try:
+        os.utime(_caminho_shard(diretorio, indice, "trava"))
+    except FileNotFoundError:
+        pass
+
+def liberar_shard(diretorio, indice):
+    try:
+        os.remove(_caminho_shard(diretorio, indice, "trava"))
+    except FileNotFoundError:
+        pass
+
+# ==================================================
+# Execução
+# ==================================================
+def executar_shard(diretorio, modulo, semente, shard):
+    """Executa todos os pontos de um shard e grava o resultado de forma atômica (roda no processo filho)."""
+    indice = shard["indice"]
+
+    resultado = {"parametros": np.array(json.dumps(shard["pontos"], ensure_ascii=False))}
+    for k, parametros in enumerate(shard["pontos"]):
+        # Semente derivada de (semente da varredura, shard, ponto): o resultado não depende de qual processo
+        # executa o shard; uma "semente" explícita na grade tem precedência
+        semente_ponto = np.random.SeedSequence(semente, spawn_key=(indice, k))
+        parametros = {"semente": semente_ponto, **parametros}
+        for nome, valor in executar_cenario({"modulo": modulo, "parametros": parametros}).items():
+            resultado[f"ponto{k:04d}_{nome}"] = valor
+
+    destino = _caminho_shard(diretorio, indice, "npz")
+    temporario = f"{destino}.{socket.gethostname()}-{os.getpid()}.tmp"
+    with open(temporario, "wb") as arquivo:
+        np.savez_compressed(arquivo, **resultado)
+    os.replace(temporario, destino)
+    return indice
+
+def executar_varredura(diretorio, num_processos=None, expiracao=3600.0):
+    """Executa os shards pendentes do manifesto, reivindicando um novo shard sempre que um processo fica livre.
+
+    Enquanto os shards rodam, o processo principal renova as suas travas a cada quarto da expiração, então
+    shards mais longos que `expiracao` não são assumidos por outro worker. Se um processo filho morre
+    (falta de memória, segfault), o pool é refeito e os shards que estavam em execução voltam a rodar, um
+    de cada vez, sem `.erro`: não dá para saber qual deles derrubou o processo. Um shard que derruba o
+    processo rodando sozinho `QUEDAS_POR_SHARD` vezes fica pendente para outra execução.
+    """
+    manifesto = carregar_manifesto(diretorio)
+    num_processos = num_processos or os.cpu_count()
+    intervalo_renovacao = expiracao / 4
+    pendentes = deque(manifesto["shards"])
+    suspeitos = deque()  # Shards em execução quando um processo filho morreu; rodam sozinhos
+    quedas = Counter()  # Quedas de cada shard rodando sozinho
+    concluidos = []
+    em_execucao = {}  # futuro -> (shard, rodando sozinho)
+    executor = ProcessPoolExecutor(max_workers=num_processos)
+
+    def submeter_proximo():
+        """Reivindica e submete o próximo shard; retorna False se não há o que submeter agora."""
+        if any(isolado for _, isolado in em_execucao.values()):
+            return False
+        while suspeitos or pendentes:
+            isolado = bool(suspeitos)
+            if isolado and em_execucao:
+                return False
+            fila = suspeitos if isolado else pendentes
+            shard = fila.popleft()
+            if not reivindicar_shard(diretorio, shard["indice"], expiracao):
+                continue
+            try:
+                futuro = executor.submit(executar_shard, diretorio, manifesto["modulo"], manifesto["semente"], shard)
+            except BaseException:
+                liberar_shard(diretorio, shard["indice"])
+                fila.appendleft(shard)
+                raise
+            em_execucao[futuro] = (shard, isolado)
+            return True
+        return False
+
+    def concluir(futuro):
+        """Registra o resultado de um futuro pronto e libera a trava; retorna False se o pool quebrou."""
+        erro = futuro.exception()
+        if isinstance(erro, BrokenProcessPool):
+            return False  # O shard fica em em_execucao e volta à fila em refazer_pool
+        shard, _ = em_execucao.pop(futuro)
+        indice = shard["indice"]
+        if erro is None:
+            concluidos.append(indice)
+        else:
+            # Um shard com falha não derruba o worker: o erro fica registrado e a varredura continua
+            registrar_erro(diretorio, indice, erro)
+            print(f"shard {indice}: {type(erro).__name__}: {erro}", file=sys.stderr)
+        liberar_shard(diretorio, indice)
+        return True
+
+    def refazer_pool():
+        """Libera e devolve às filas os shards interrompidos e troca o pool quebrado por um novo."""
+        nonlocal executor
+        # Com o pool quebrado, todos os futuros terminam logo; os que acabaram antes da queda valem
+        wait(em_execucao)
+        for futuro in list(em_execucao):
+            concluir(futuro)
+        for shard, isolado in em_execucao.values():
+            indice = shard["indice"]
+            liberar_shard(diretorio, indice)
+            if isolado:
+                quedas[indice] += 1
+                if quedas[indice] >= QUEDAS_POR_SHARD:
+                    print(f"shard {indice}: o processo caiu {quedas[indice]} vezes com o shard sozinho; fica pendente",
+                          file=sys.stderr)
+                    continue
+            suspeitos.append(shard)
+        em_execucao.clear()
+        executor.shutdown(cancel_futures=True)
+        executor = ProcessPoolExecutor(max_workers=num_processos)
+
+    def preencher():
+        while len(em_execucao) < num_processos:
+            try:
+                if not submeter_proximo():
+                    return
+            except BrokenProcessPool:
+                refazer_pool()
+
+    try:
+        preencher()
+        while em_execucao:
+            prontos, _ = wait(em_execucao, timeout=intervalo_renovacao, return_when=FIRST_COMPLETED)
+            for shard, _ in em_execucao.values():
+                renovar_trava(diretorio, shard["indice"])
+            if not all([concluir(futuro) for futuro in prontos]):
+                print("processo filho encerrado; refazendo o pool e repetindo os shards interrompidos", file=sys.stderr)
+                refazer_pool()
+            preencher()
+    finally:
+        executor.shutdown()
+    return concluidos
+
+def status_varredura(diretorio):
+    """Conta shards concluídos, com erro, em execução e pendentes, e lista a última linha de cada erro."""
+    manifesto = carregar_manifesto(diretorio)
+    contagem = {"concluidos": 0, "com_erro": 0, "em_execucao": 0, "pendentes": 0, "erros": {}}
+    for shard in manifesto["shards"]:
+        if shard_concluido(diretorio, shard["indice"]):
+            contagem["concluidos"] += 1
+        elif shard_com_erro(diretorio, shard["indice"]):
+            contagem["com_erro"] += 1
+            with open(_caminho_shard(diretorio, shard["indice"], "erro"), encoding="utf-8") as arquivo:
+                linhas = arquivo.read().strip().splitlines()
+            contagem["erros"][shard["indice"]] = linhas[-1] if linhas else ""
+        elif os.path.exists(_caminho_shard(diretorio, shard["indice"], "trava")):
+            contagem["em_execucao"] += 1
+        else:
+            contagem["pendentes"] += 1
+    return contagem
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Varreduras de parâmetros em shards retomáveis.")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    criar = subparsers.add_parser("criar", help="Cria o manifesto de shards a partir de uma grade de parâmetros")
+    criar.add_argument("diretorio")
+    criar.add_argument("--modulo", required=True, choices=sorted(MODULOS))
+    criar.add_argument("--grade", required=True, help="Arquivo JSON {parâmetro: [valores]}")
+    criar.add_argument("--tamanho-shard", type=int, default=1)
+    criar.add_argument("--semente", type=int, default=0)
+
+    executar = subparsers.add_parser("executar", help="Executa os shards pendentes")
+    executar.add_argument("diretorio")
+    executar.add_argument("--processos", type=int, default=None)
+    executar.add_argument("--expiracao", type=float, default=3600.0,
+                          help="Segundos após os quais a trava de um worker que caiu é considerada abandonada")
+
+    status = subparsers.add_parser("status", help="Mostra o andamento da varredura")
+    status.add_argument("diretorio")
+
+    args = parser.parse_args(argv)
+    if args.comando == "criar":
+        with open(args.grade, encoding="utf-8") as arquivo:
+            grade = json.load(arquivo)
+        try:
+            manifesto = criar_manifesto(args.diretorio, args.modulo, grade, args.tamanho_shard, args.semente)
+        except FileExistsError:
+            raise SystemExit(f"Já existe um manifesto em {args.diretorio}; use 'executar' para continuar a varredura.")
+        print(f"{len(manifesto['shards'])} shards em {args.diretorio}")
+    elif args.comando == "executar":
+        concluidos = executar_varredura(args.diretorio, args.processos, args.expiracao)
+        print(f"{len(concluidos)} shards executados neste worker")
+    else:
+        print(json.dumps(status_varredura(args.diretorio), ensure_ascii=False))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())